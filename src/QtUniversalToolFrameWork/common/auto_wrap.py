@@ -1,6 +1,6 @@
 from enum import Enum, auto
 from functools import lru_cache
-from re import sub
+from re import compile, sub
 from typing import List, Optional, Tuple  # 导入类型注解，指定函数参数和返回值类型
 from unicodedata import east_asian_width  # 导入获取字符宽度的函数，用于判断字符是全角还是半角
 
@@ -15,6 +15,8 @@ class CharType(Enum):
 class TextWrap:
     """文本自动换行处理类，支持根据字符宽度（中文2，英文1）进行智能换行"""
 
+    ASCII_TOKEN_PATTERN = compile(r"[^\s]+|\s")  # ASCII 文本分词：连续的非空白字符为一个 token，每个空白字符单独为一个 token
+
     EAST_ASAIN_WIDTH_TABLE = {
         "F": 2,  # 全角字符宽度为2
         "H": 1,  # 半角字符宽度为1
@@ -49,6 +51,9 @@ class TextWrap:
         Returns:
             文本的总宽度（单位：字符数）
         """
+        if text.isascii():  # ASCII 字符宽度均为1，直接由 C 实现的 isascii 判断，无需逐字符查表
+            return len(text)
+
         return sum(cls.get_width(char) for char in text)
 
     @classmethod
@@ -92,6 +97,12 @@ class TextWrap:
         Yields:
             按字符类型分割的 token 字符串（如"你好abc " → ["你好", "abc", " "]）
         """
+        if text.isascii():
+            # ASCII 文本中只有空格和拉丁字符，直接由正则引擎分词，避免逐字符判断类型
+            tokens = cls.ASCII_TOKEN_PATTERN.findall(text)
+            yield from tokens or [""]
+            return
+
         buffer = ""
         last_char_type: Optional[CharType] = None 
 
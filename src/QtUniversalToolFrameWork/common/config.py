@@ -363,7 +363,7 @@ class QConfig(QObject):
 
 
 def isDarkTheme():
-    return qconfig.get(qconfig.themeMode) == Theme.DARK
+    return _ThemeState.dark
 
 def theme():
     return qconfig.get(qconfig.themeMode)
@@ -372,11 +372,24 @@ def isDarkThemeMode(theme=Theme.AUTO):
     return theme == Theme.DARK if theme != Theme.AUTO else isDarkTheme()
 
 
+class _ThemeState:
+    """ 深色主题标志缓存：由 isDarkTheme 读取，主题配置项的值变化时刷新 """
+
+    dark = False
+
+    @classmethod
+    def refresh(cls, *args):
+        cls.dark = qconfig.get(qconfig.themeMode) == Theme.DARK
+
+
 
 AUTHOR = "HJN"
 VERSION = "0.3.2"
 
 qconfig = QConfig()
+_ThemeState.refresh()
+# 所有写入路径（set、load、直接赋值 value）都经过配置项的 setter，且先于 themeChanged 发射 valueChanged
+qconfig.themeMode.valueChanged.connect(_ThemeState.refresh)
 
 
 
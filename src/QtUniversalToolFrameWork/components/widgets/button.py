@@ -1,14 +1,15 @@
 from typing import Union
 
 from PyQt5.QtCore import pyqtSignal, QUrl, Qt, QRectF, QSize, QPoint, pyqtProperty, QRect
-from PyQt5.QtGui import QDesktopServices, QIcon, QPainter, QColor, QPainterPath
+from PyQt5.QtGui import QDesktopServices, QIcon, QPainter, QColor, QPainterPath, QPixmap
 from PyQt5.QtWidgets import QHBoxLayout, QPushButton, QRadioButton, QToolButton, QApplication, QWidget, QSizePolicy
 
 from ...common.animation import TranslateYAnimation
-from ...common.icon import FluentIconBase, drawIcon, isDarkTheme, Theme, toQIcon, Icon
+from ...common.icon import FluentIconBase, drawIcon, Theme, toQIcon, Icon
 from ...common.icon import FluentIcon as FIF
 from ...common.font import setFont, getFont
 from ...common.style_sheet import FluentStyleSheet, themeColor, ThemeColor
+from ...common.config import qconfig, isDarkTheme
 from ...common.color import autoFallbackThemeColor
 from ...common.overload import singledispatchmethod
 
@@ -866,9 +867,11 @@ class DropDownToolButton(DropDownButtonBase, ToolButton):
         self._showMenu()  # 显示下拉菜单
 
     def _drawIcon(self, icon, painter, rect: QRectF):
-        """ 重绘图标方法，调整图标位置使其不与下拉箭头重叠 """
-        rect.moveLeft(12)  # 调整图标位置到左侧
-        return super()._drawIcon(icon, painter, rect)  # 调用父类方法绘制图标
+        """ 重绘图标方法，通过平移画家坐标系将图标左移，使其不与下拉箭头重叠 """
+        painter.save()
+        painter.translate(12 - rect.x(), 0)  # 调整图标位置到左侧
+        super()._drawIcon(icon, painter, rect)  # 调用父类方法绘制图标
+        painter.restore()
 
     def paintEvent(self, e):
         """ 处理重绘事件，先调用ToolButton的绘制方法，再调用DropDownButtonBase的绘制方法 """
@@ -886,15 +889,48 @@ class TransparentDropDownToolButton(DropDownToolButton):
     """
 
 
+_ARROW_PIXMAPS = {}  # 主色调下拉箭头位图缓存，键为 (是否深色主题, 尺寸, 设备像素比)
+qconfig.themeChanged.connect(_ARROW_PIXMAPS.clear)  # 主题变更时清空缓存
+
+
+def _getArrowPixmap(size: QSize, dpr: float, isDark: bool) -> QPixmap:
+    """ 获取预渲染的主色调下拉箭头位图，首次调用时渲染 SVG 并缓存
+
+    参数:
+        size: 箭头尺寸
+        dpr: 设备像素比
+        isDark: 是否为深色主题
+    """
+    key = (isDark, size.width(), size.height(), dpr)
+    pixmap = _ARROW_PIXMAPS.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap(size * dpr)
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHints(QPainter.Antialiasing)
+    theme = Theme.LIGHT if isDark else Theme.DARK  # 反转主题以适应主色调背景
+    FIF.ARROW_DOWN.render(painter, QRectF(0, 0, size.width(), size.height()), theme)
+    painter.end()
+
+    _ARROW_PIXMAPS[key] = pixmap
+    return pixmap
+
+
 class PrimaryDropDownButtonBase(DropDownButtonBase):
     """ 主色调下拉按钮基类 """
 
     def _drawDropDownIcon(self, painter, rect):
         """ 重绘下拉箭头图标方法，为主色调按钮提供特殊的箭头颜色
-        根据当前主题自动反转箭头颜色以适应主色调背景
+        根据当前主题自动反转箭头颜色以适应主色调背景，使用缓存的位图避免每次重绘都渲染 SVG
         """
-        theme = Theme.DARK if not isDarkTheme() else Theme.LIGHT  # 反转主题
-        FIF.ARROW_DOWN.render(painter, rect, theme)  # 使用反转后的主题绘制箭头
+        rect = QRectF(rect)
+        size = QSize(round(rect.width()), round(rect.height()))
+        pixmap = _getArrowPixmap(size, painter.device().devicePixelRatioF(), isDarkTheme())
+        painter.drawPixmap(rect.topLeft(), pixmap)  # 直接绘制缓存位图
 
 
 class PrimaryDropDownPushButton(PrimaryDropDownButtonBase, PrimaryPushButton):
@@ -934,9 +970,11 @@ class PrimaryDropDownToolButton(PrimaryDropDownButtonBase, PrimaryToolButton):
         self._showMenu()  # 显示下拉菜单
 
     def _drawIcon(self, icon, painter, rect: QRectF):
-        """ 重绘图标方法，调整图标位置使其不与下拉箭头重叠 """
-        rect.moveLeft(12)  # 调整图标位置到左侧
-        return super()._drawIcon(icon, painter, rect)  # 调用父类方法绘制图标
+        """ 重绘图标方法，通过平移画家坐标系将图标左移，使其不与下拉箭头重叠 """
+        painter.save()
+        painter.translate(12 - rect.x(), 0)  # 调整图标位置到左侧
+        super()._drawIcon(icon, painter, rect)  # 调用父类方法绘制图标
+        painter.restore()
 
     def paintEvent(self, e):
         """ 处理重绘事件，先调用PrimaryToolButton的绘制方法，再调用PrimaryDropDownButtonBase的绘制方法 """
@@ -956,8 +994,6 @@ class SplitDropButton(ToolButton):
 
     def _drawIcon(self, icon, painter, rect):
         """ 重绘图标方法，应用动画效果并根据按钮状态设置不同透明度 """
-        rect.translate(0, self.arrowAni.y)  # 应用动画位移
-
         if self.isPressed:  # 如果按钮被按下
             painter.setOpacity(0.5)  # 设置透明度
         elif self.isHover:  # 如果鼠标悬停
@@ -965,7 +1001,10 @@ class SplitDropButton(ToolButton):
         else:  # 默认状态
             painter.setOpacity(0.63)  # 设置透明度
 
+        painter.save()
+        painter.translate(0, self.arrowAni.y)  # 应用动画位移
         super()._drawIcon(icon, painter, rect)  # 调用父类方法绘制图标
+        painter.restore()
 
 
 class PrimarySplitDropButton(PrimaryToolButton):
@@ -980,8 +1019,6 @@ class PrimarySplitDropButton(PrimaryToolButton):
 
     def _drawIcon(self, icon, painter, rect):
         """ 重绘图标方法，应用动画效果、设置透明度并根据主题反转图标颜色 """
-        rect.translate(0, self.arrowAni.y)  # 应用动画位移
-
         if self.isPressed:  # 如果按钮被按下
             painter.setOpacity(0.7)  # 设置透明度
         elif self.isHover:  # 如果鼠标悬停
@@ -993,7 +1030,10 @@ class PrimarySplitDropButton(PrimaryToolButton):
             # 根据主题反转图标颜色以适应主色调背景
             icon = icon.icon(Theme.DARK if not isDarkTheme() else Theme.LIGHT)
 
+        painter.save()
+        painter.translate(0, self.arrowAni.y)  # 应用动画位移
         super()._drawIcon(icon, painter, rect)  # 调用父类方法绘制图标
+        painter.restore()
 
 
 class SplitWidgetBase(QWidget):
@@ -1100,6 +1140,31 @@ class SplitPushButton(SplitWidgetBase):
     # 使用 singledispatchmethod 装饰器实现构造方法的重载，处理仅传入父控件的情况
     @singledispatchmethod
     def __init__(self, parent: QWidget = None):
+        self._initCore(parent)
+
+    # 注册另一个构造方法，处理传入文本、父控件和图标的情况
+    @__init__.register
+    def _(self, text: str, parent: QWidget = None, icon: Union[QIcon, str, FluentIconBase] = None):
+        self._initCore(parent, text, icon)
+
+    # 注册构造方法，处理传入QIcon图标、文本和父控件的情况（图标在前，文本在后）
+    @__init__.register
+    def _(self, icon: QIcon, text: str, parent: QWidget = None):
+        self._initCore(parent, text, icon)
+
+    # 注册构造方法，处理传入FluentIconBase图标、文本和父控件的情况（图标在前，文本在后）
+    @__init__.register
+    def _(self, icon: FluentIconBase, text: str, parent: QWidget = None):
+        self._initCore(parent, text, icon)
+
+    def _initCore(self, parent: QWidget = None, text: str = None, icon: Union[QIcon, str, FluentIconBase] = None):
+        """ 构造方法的公共实现，各重载直接调用，避免再次经过分派
+
+        参数:
+            parent: 父窗口控件
+            text: 按钮文本，为None时不设置
+            icon: 按钮图标，为None时不设置
+        """
         # 调用父类 SplitWidgetBase 的构造方法
         super().__init__(parent=parent)
         # 创建一个普通按钮作为主按钮
@@ -1113,27 +1178,13 @@ class SplitPushButton(SplitWidgetBase):
         # 调用初始化后处理方法
         self._postInit()
 
-    # 注册另一个构造方法，处理传入文本、父控件和图标的情况
-    @__init__.register
-    def _(self, text: str, parent: QWidget = None, icon: Union[QIcon, str, FluentIconBase] = None):
-        # 先调用仅含父控件的构造方法进行基础初始化
-        self.__init__(parent)
-        # 设置按钮文本
-        self.setText(text)
-        # 设置按钮图标
-        self.setIcon(icon)
-
-    # 注册构造方法，处理传入QIcon图标、文本和父控件的情况（图标在前，文本在后）
-    @__init__.register
-    def _(self, icon: QIcon, text: str, parent: QWidget = None):
-        # 调用文本在前的构造方法，调整参数顺序
-        self.__init__(text, parent, icon)
+        if text is None:
+            return
 
-    # 注册构造方法，处理传入FluentIconBase图标、文本和父控件的情况（图标在前，文本在后）
-    @__init__.register
-    def _(self, icon: FluentIconBase, text: str, parent: QWidget = None):
-        # 调用文本在前的构造方法，调整参数顺序
-        self.__init__(text, parent, icon)
+        # 直接设置主按钮的文本和图标，最后统一调整一次尺寸
+        self.button.setText(text)
+        self.button.setIcon(icon)
+        self.adjustSize()
 
     def _postInit(self):
         """ 初始化后处理方法，子类可重写以实现特定逻辑 """
@@ -1144,13 +1195,23 @@ class SplitPushButton(SplitWidgetBase):
         return self.button.text()
 
     def setText(self, text: str):
-        """ 设置按钮文本并调整控件大小
+        """ 设置按钮文本并通知布局重新计算尺寸
         
         参数:
             text: 要设置的文本字符串
         """
+        if text == self.button.text():
+            return
+
         self.button.setText(text)
-        self.adjustSize()
+        self._updateSize()
+
+    def _updateSize(self):
+        """ 尺寸提示变化后的处理：交由布局在下一轮事件循环中统一重排，未受布局管理时才立即调整大小 """
+        if self.testAttribute(Qt.WA_LaidOut):
+            self.updateGeometry()
+        else:
+            self.adjustSize()
 
     def icon(self):
         """ 获取按钮图标 """
@@ -1163,6 +1224,7 @@ class SplitPushButton(SplitWidgetBase):
             icon: 支持QIcon对象、FluentIconBase图标或图片路径字符串
         """
         self.button.setIcon(icon)
+        self.updateGeometry()
 
     def setIconSize(self, size: QSize):
         """ 设置图标大小
@@ -1171,6 +1233,7 @@ class SplitPushButton(SplitWidgetBase):
             size: QSize对象，表示图标尺寸
         """
         self.button.setIconSize(size)
+        self.updateGeometry()
 
     # 定义文本属性，可用于QSS样式表和属性绑定
     text_ = pyqtProperty(str, text, setText)
@@ -1227,6 +1290,30 @@ class SplitToolButton(SplitWidgetBase):
     # 使用 singledispatchmethod 装饰器实现构造方法的重载，处理仅传入父控件的情况
     @singledispatchmethod
     def __init__(self, parent: QWidget = None):
+        self._initCore(parent)
+
+    # 注册构造方法，处理传入FluentIconBase图标和父控件的情况
+    @__init__.register
+    def _(self, icon: FluentIconBase, parent: QWidget = None):
+        self._initCore(parent, icon)
+
+    # 注册构造方法，处理传入QIcon图标和父控件的情况
+    @__init__.register
+    def _(self, icon: QIcon, parent: QWidget = None):
+        self._initCore(parent, icon)
+
+    # 注册构造方法，处理传入图片路径字符串（图标）和父控件的情况
+    @__init__.register
+    def _(self, icon: str, parent: QWidget = None):
+        self._initCore(parent, icon)
+
+    def _initCore(self, parent: QWidget = None, icon: Union[QIcon, str, FluentIconBase] = None):
+        """ 构造方法的公共实现，各重载直接调用，避免再次经过分派
+
+        参数:
+            parent: 父窗口控件
+            icon: 按钮图标，为None时不设置
+        """
         # 调用父类 SplitWidgetBase 的构造方法
         super().__init__(parent=parent)
         # 创建一个工具按钮作为主按钮
@@ -1240,29 +1327,8 @@ class SplitToolButton(SplitWidgetBase):
         # 调用初始化后处理方法
         self._postInit()
 
-    # 注册构造方法，处理传入FluentIconBase图标和父控件的情况
-    @__init__.register
-    def _(self, icon: FluentIconBase, parent: QWidget = None):
-        # 先调用仅含父控件的构造方法进行基础初始化
-        self.__init__(parent)
-        # 设置按钮图标
-        self.setIcon(icon)
-
-    # 注册构造方法，处理传入QIcon图标和父控件的情况
-    @__init__.register
-    def _(self, icon: QIcon, parent: QWidget = None):
-        # 先调用仅含父控件的构造方法进行基础初始化
-        self.__init__(parent)
-        # 设置按钮图标
-        self.setIcon(icon)
-
-    # 注册构造方法，处理传入图片路径字符串（图标）和父控件的情况
-    @__init__.register
-    def _(self, icon: str, parent: QWidget = None):
-        # 先调用仅含父控件的构造方法进行基础初始化
-        self.__init__(parent)
-        # 设置按钮图标
-        self.setIcon(icon)
+        if icon is not None:
+            self.button.setIcon(icon)
 
     def _postInit(self):
         """ 初始化后处理方法，子类可重写以实现特定逻辑 """
@@ -1325,10 +1391,34 @@ class PrimarySplitToolButton(SplitToolButton):
 class PillButtonBase:
     """ 药丸形状按钮的基类（提供药丸形状的绘制逻辑） """
 
+    _pillSize = None   # 缓存路径对应的按钮尺寸
+    _pillPaths = None  # 缓存的药丸形状路径：(未选中时内缩1像素的路径, 选中时整个区域的路径)
+
     def __init__(self, *args, **kwargs):
         # 调用父类的构造方法，兼容不同父类的初始化参数
         super().__init__(*args, **kwargs)
 
+    def _pillPath(self, checked: bool) -> QPainterPath:
+        """ 获取药丸形状的绘制路径，仅在按钮尺寸变化时重新构建
+
+        参数:
+            checked: 是否为选中状态
+        """
+        if self._pillSize != self.size():
+            self._pillSize = self.size()
+            self._pillPaths = (self._createPillPath(QRectF(self.rect().adjusted(1, 1, -1, -1))),
+                               self._createPillPath(QRectF(self.rect())))
+
+        return self._pillPaths[checked]
+
+    @staticmethod
+    def _createPillPath(rect: QRectF) -> QPainterPath:
+        """ 创建圆角半径为高度一半的圆角矩形路径 """
+        path = QPainterPath()
+        r = rect.height() / 2
+        path.addRoundedRect(rect, r, r)
+        return path
+
     def paintEvent(self, e):
         """ 重写绘制事件，实现药丸形状的外观
         
@@ -1342,10 +1432,10 @@ class PillButtonBase:
         # 判断当前是否为深色主题
         isDark = isDarkTheme()
 
+        isChecked = self.isChecked()
+
         # 如果按钮未被选中
-        if not self.isChecked():
-            # 调整绘制区域（向内缩进1像素）
-            rect = self.rect().adjusted(1, 1, -1, -1)
+        if not isChecked:
             # 根据主题设置边框颜色
             borderColor = QColor(255, 255, 255, 18) if isDark else QColor(0, 0, 0, 15)
 
@@ -1371,18 +1461,14 @@ class PillButtonBase:
 
             # 选中状态下无边框
             borderColor = Qt.transparent
-            # 绘制区域为整个按钮区域
-            rect = self.rect()
 
         # 设置画笔（边框）颜色
         painter.setPen(borderColor)
         # 设置画刷（背景）颜色
         painter.setBrush(bgColor)
 
-        # 计算圆角半径（高度的一半，实现药丸形状）
-        r = rect.height() / 2
-        # 绘制圆角矩形（药丸形状）
-        painter.drawRoundedRect(rect, r, r)
+        # 绘制缓存的药丸形状路径（未选中时内缩1像素，选中时为整个按钮区域）
+        painter.drawPath(self._pillPath(isChecked))
 
 
 class PillPushButton(TogglePushButton, PillButtonBase):
@@ -1,11 +1,12 @@
 # coding:utf-8
 from typing import Iterable 
-from PyQt5.QtCore import Qt, pyqtSignal, QSize, QEvent, QRectF
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QEvent, QRectF, QTimer, QAbstractAnimation
 from PyQt5.QtGui import QPainter
 from PyQt5.QtWidgets import QListWidget, QListWidgetItem, QToolButton
 
 
-from ...common.icon import FluentIcon, isDarkTheme 
+from ...common.icon import FluentIcon
+from ...common.config import isDarkTheme
 
 from .scroll_area import SmoothScrollBar
 
@@ -25,6 +26,7 @@ class ScrollButton(QToolButton):
         super().__init__(parent=parent) 
         self._icon = icon
         self.isPressed = False
+        self._iconRects = (QRectF(), QRectF())  # 未按下/按下状态下的图标区域，尺寸变化时更新
         
         self.installEventFilter(self)
 
@@ -56,22 +58,32 @@ class ScrollButton(QToolButton):
         参数:
             e: QPaintEvent - 绘制事件对象
         """
+        if not self.isVisible() or self.width() == 0 or self.height() == 0:  # 不可见或尺寸为0时无需绘制
+            return
+
         super().paintEvent(e)
         painter = QPainter(self)
         painter.setRenderHints(QPainter.Antialiasing)  # 设置抗锯齿渲染
 
-        if not self.isPressed: # 如果按钮未被按下
-            w, h = 10, 10 
-        else:
-            w, h = 8, 8 
-
-        x = (self.width() - w) / 2  # 计算图标X坐标（水平居中）
-        y = (self.height() - h) / 2  # 计算图标Y坐标（垂直居中）
+        rect = self._iconRects[self.isPressed]  # 根据按下状态选择图标区域
 
         if not isDarkTheme():  # 如果当前不是深色主题
-            self._icon.render(painter, QRectF(x, y, w, h), fill="#5e5e5e")  # 渲染图标并设置填充色
+            self._icon.render(painter, rect, fill="#5e5e5e")  # 渲染图标并设置填充色
         else:
-            self._icon.render(painter, QRectF(x, y, w, h))  # 使用默认颜色渲染图标
+            self._icon.render(painter, rect)  # 使用默认颜色渲染图标
+
+    def resizeEvent(self, e):
+        """
+        尺寸调整事件 - 预先计算图标的绘制区域
+        
+        参数:
+            e: QResizeEvent - 尺寸调整事件对象
+        """
+        super().resizeEvent(e)
+        self._iconRects = tuple(
+            QRectF((self.width() - w) / 2, (self.height() - w) / 2, w, w)  # 图标水平垂直居中
+            for w in (10, 8)  # 未按下时图标为10x10，按下时为8x8
+        )
 
 
 class CycleListWidget(QListWidget):
@@ -102,6 +114,11 @@ class CycleListWidget(QListWidget):
         self.vScrollBar = SmoothScrollBar(Qt.Vertical, self) 
         self.visibleNumber = 9
 
+        self._wheelAccum = 0  # 累积的滚轮步数
+        self._wheelTimer = QTimer(self)  # 滚轮事件合并定时器
+        self._wheelTimer.setSingleShot(True)  # 设置为单次触发模式
+        self._wheelTimer.timeout.connect(self._flushWheel)  # 事件循环空闲时统一处理累积的滚轮步数
+
         # 重复添加项目以实现循环滚动效果
         self.setItems(items)  # 设置列表项目
 
@@ -127,8 +144,24 @@ class CycleListWidget(QListWidget):
 
     def setItems(self, items: list):
         """ 设置列表中的项目 """
-        self.clear()
-        self._createItems(items)
+        self._lastEmittedIndex = None  # 最近一次发射 currentItemChanged 信号时的索引
+
+        # 批量替换期间禁用重绘并阻塞模型信号，避免逐项触发视图更新
+        self.setUpdatesEnabled(False)
+        self.model().blockSignals(True)
+        try:
+            self.clear()
+            self._createItems(items)
+        finally:
+            self.model().blockSignals(False)
+            self.reset()  # 模型信号被阻塞，需要手动重置视图状态并重新布局
+            self.doItemsLayout()
+            self.setUpdatesEnabled(True)
+
+        if self.isCycle:  # 从第一组末尾开始显示
+            super().scrollToItem(self.item(self.currentIndex()-self.visibleNumber//2), QListWidget.PositionAtTop)
+
+        self.viewport().update()
 
     def _createItems(self, items: list):
         """
@@ -141,11 +174,9 @@ class CycleListWidget(QListWidget):
         self.isCycle = N > self.visibleNumber  # 判断是否需要循环滚动（项目数大于可见数）
 
         if self.isCycle:
-            for _ in range(2):
-                self._addColumnItems(items) 
+            self._addCycleItems(items)
 
             self._currentIndex = len(items)  # 设置当前索引为第一组的末尾
-            super().scrollToItem(self.item(self.currentIndex()-self.visibleNumber//2), QListWidget.PositionAtTop)  # 从顶部位置开始显示
         else:
             n = self.visibleNumber // 2 
 
@@ -172,6 +203,23 @@ class CycleListWidget(QListWidget):
 
             self.addItem(item)  # 添加项目到列表
 
+    def _addCycleItems(self, items):
+        """
+        内部方法：一次性添加重复两遍的项目（循环模式）
+        
+        参数:
+            items: list - 要添加的项目列表
+        """
+        start = self.count()
+        texts = [str(i) for i in items] * 2  # 重复两遍以实现循环滚动效果
+        self.addItems(texts)  # 批量添加项目
+
+        align = self.align | Qt.AlignVCenter
+        for row in range(start, start + len(texts)):
+            item = self.item(row)
+            item.setSizeHint(self.itemSize)
+            item.setTextAlignment(align)
+
     def _onItemClicked(self, item):
         """
         内部方法：处理项目点击事件
@@ -201,6 +249,7 @@ class CycleListWidget(QListWidget):
         else:  # 如果只找到一个匹配项
             self.setCurrentIndex(self.row(items[0]))  # 选择第一个匹配项
 
+        self._lastEmittedIndex = self.currentIndex()  # 调用方已知选中项，无需再次发射信号
         super().scrollToItem(self.currentItem(), QListWidget.PositionAtCenter)  # 滚动到项目中心位置
 
     def scrollToItem(self, item: QListWidgetItem, hint=QListWidget.PositionAtCenter):
@@ -214,13 +263,20 @@ class CycleListWidget(QListWidget):
         # 滚动到中心位置
         index = self.row(item)  # 获取项目的行号
         y = item.sizeHint().height() * (index - self.visibleNumber // 2)  # 计算滚动位置
-        self.vScrollBar.scrollTo(y)  # 使用平滑滚动条滚动到指定位置
+        if y != self.vScrollBar.value() or self._isScrolling():
+            self.vScrollBar.scrollTo(y)  # 使用平滑滚动条滚动到指定位置
 
         # 清除选择
         self.clearSelection()  # 清除所有选择
         item.setSelected(False)  # 取消当前项目的选中状态
 
-        self.currentItemChanged.emit(item)  # 发射当前项目变更信号
+        if index != self._lastEmittedIndex:  # 仅在当前项目确实变化时发射信号
+            self._lastEmittedIndex = index
+            self.currentItemChanged.emit(item)  # 发射当前项目变更信号
+
+    def _isScrolling(self):
+        """ 内部方法：平滑滚动动画是否正在进行 """
+        return self.vScrollBar.ani.state() == QAbstractAnimation.Running
 
     def wheelEvent(self, e):
         """
@@ -229,10 +285,24 @@ class CycleListWidget(QListWidget):
         参数:
             e: QWheelEvent - 鼠标滚轮事件对象
         """
-        if e.angleDelta().y() < 0:  # 滚轮向下滚动
-            self.scrollDown()  # 向下滚动一个项目
-        else:  # 滚轮向上滚动
-            self.scrollUp()  # 向上滚动一个项目
+        self._wheelAccum += 1 if e.angleDelta().y() < 0 else -1  # 向下滚动加1，向上滚动减1
+        if not self._wheelTimer.isActive():
+            self._wheelTimer.start(0)  # 合并同一轮事件循环中的多次滚轮事件
+
+    def _flushWheel(self):
+        """ 内部方法：将累积的滚轮步数一次性滚动到目标项目 """
+        if self._wheelAccum == 0:
+            return
+
+        steps = self._wheelAccum
+        self._wheelAccum = 0
+        if self.isCycle:  # 循环模式下滚动整圈等于原地不动，只保留不足一圈的步数（保持方向）
+            N = self.count() // 2  # 列表中项目被重复添加了两次
+            steps = abs(steps) % N * (1 if steps > 0 else -1)
+
+        index = self.currentIndex() + steps  # 计算目标索引，非循环模式由 setCurrentIndex 限制范围
+        self.setCurrentIndex(index)
+        self.scrollToItem(self.currentItem())  # 滚动到新的当前项目
 
     def scrollDown(self):
         """ 向下滚动一个项目 """
@@ -323,15 +393,27 @@ class CycleListWidget(QListWidget):
             n = self.visibleNumber // 2  # 计算可见区域的中间位置
             self._currentIndex = max(  # 限制索引范围在有效项目区间内
                 n, min(n + len(self.originItems) - 1, index))
-        else:  # 如果是循环模式
-            N = self.count() // 2  # 获取一半项目数量（因为列表中项目被重复添加了两次）
-            m = (self.visibleNumber + 1) // 2  # 计算中间位置
-            self._currentIndex = index  # 设置当前索引
-
-            # 滚动到中心位置以实现循环滚动效果
-            if index >= self.count() - m:  # 如果索引接近列表末尾
-                self._currentIndex = N + index - self.count()  # 重置索引到开头区域
-                super().scrollToItem(self.item(self.currentIndex() - 1), self.PositionAtCenter)  # 滚动到新位置
-            elif index <= m - 1:  # 如果索引接近列表开头
-                self._currentIndex = N + index  # 重置索引到末尾区域
-                super().scrollToItem(self.item(N + index + 1), self.PositionAtCenter)  # 滚动到新位置
\ No newline at end of file
+            return
+
+        N = self.count() // 2  # 获取一半项目数量（因为列表中项目被重复添加了两次）
+        m = (self.visibleNumber + 1) // 2  # 计算中间位置
+        index %= self.count()  # 第 i 项与第 i+N 项相同，先将任意索引归一化到列表范围内
+
+        # 滚动到中心位置以实现循环滚动效果
+        if index >= self.count() - m:  # 如果索引接近列表末尾
+            index = N + index - self.count()  # 重置索引到开头区域
+            anchor = self.item(index - 1)
+        elif index <= m - 1:  # 如果索引接近列表开头
+            index = N + index  # 重置索引到末尾区域
+            anchor = self.item(index + 1)
+        else:
+            anchor = None
+
+        # 索引未变化且没有进行中的滚动动画时，视图已停留在该项目上，无需重新定位
+        if index == self._lastEmittedIndex and not self._isScrolling():
+            self._currentIndex = index
+            return
+
+        self._currentIndex = index  # 设置当前索引
+        if anchor is not None:
+            super().scrollToItem(anchor, self.PositionAtCenter)  # 滚动到新位置
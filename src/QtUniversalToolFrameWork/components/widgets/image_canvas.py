@@ -1,59 +1,49 @@
 # coding=utf-8
+import math
+
 from PyQt5.QtWidgets import QLabel,QFrame,QWidget,QHBoxLayout,QVBoxLayout,QCompleter
-from PyQt5.QtGui import QPainter, QPixmap, QTransform,QFont,QColor,QPainterPath
-from PyQt5.QtCore import Qt, QPoint, pyqtSignal, QPointF,QTimer,QRectF,QSize
+from PyQt5.QtGui import QPainter, QPixmap, QImage, QTransform,QFont,QPixmapCache
+from PyQt5.QtCore import Qt, QPoint, pyqtSignal, QPointF,QTimer,QSize,QRect
 
 from PyQt5.QtCore import pyqtSignal
 
 from ...common.font import getFont
+from ...common.cache import LRUCache
 
 from .line_edit import SearchLineEdit,NumberEdit
 from .flyout import FlyoutViewBase
 from .slider import Slider
 
+SCALED_PIXMAP_CACHE_LIMIT = 128 * 1024  # 缩放结果所需的全局缓存容量（KB），创建画布时按需提高，不会降低宿主程序的设置
+
+
 class ScaleLabel(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(60, 26)
         self.hide_scale()
+
+        self._hide_timer = QTimer(self)  # 复用同一个定时器，连续缩放时只需重新计时
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.hide_scale)
         self.setAlignment(Qt.AlignCenter)
-        self._scale = 1
+        self.setFont(getFont(12, QFont.ExtraBold))
+        self.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 90);"
+            "border-radius: 13px;"
+            "color: white;"
+            "padding-left: 4px;"
+        )
+        self.setText("100%")
     
     def show_scale(self, scale):
         """ 显示缩放比例标签 """
-        self._scale = int(scale*100)
+        self.setText(f"{int(scale*100)}%")
         # 判断是否可见
         if not self.isVisible():
             self.show()
-            QTimer.singleShot(2000, self.hide_scale)
-        
-
-    def paintEvent(self, e):
-        """ 绘制事件处理 """
-        painter = QPainter(self)
-
-        painter.setRenderHints(
-            QPainter.TextAntialiasing |
-            QPainter.HighQualityAntialiasing |
-            QPainter.SmoothPixmapTransform 
-        )
-        
-        rectf = QRectF(self.rect()) 
-        rounded_rect = QPainterPath() # 创建圆角矩形路径
-        rounded_rect.addRoundedRect(rectf, 13, 13)
-
-        painter.setBrush(QColor(0, 0, 0, 90))
-        painter.setPen(Qt.NoPen)
-        painter.drawPath(rounded_rect)
-
-        
-        painter.setPen(QColor(255, 255, 255))
-
-        rectf.adjust(5,1,-1,-1)
-
-        painter.setFont(getFont(12, QFont.ExtraBold))
 
-        painter.drawText(rectf, Qt.AlignCenter, f"{self._scale}%")
+        self._hide_timer.start(2000)
 
     def hide_scale(self):
         """ 隐藏缩放比例标签 """
@@ -80,6 +70,12 @@ class ImageSearchFlyoutView(FlyoutViewBase):
         self._searchLineEdit = SearchLineEdit(self)
         self._searchLineEdit.hBoxLayout.setContentsMargins(0, 0, 12, 0)
         self._searchLineEdit.searchSignal.connect(self.searchSignal)
+
+        # 只创建一次自动完成器，更新图片名称列表时直接替换模型中的数据
+        self._completer = QCompleter([], self)
+        self._completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self._completer.setMaxVisibleItems(10)
+        self._searchLineEdit.setCompleter(self._completer)
         self._init_ui()
         self.set_stands(self._stands)
 
@@ -101,10 +97,7 @@ class ImageSearchFlyoutView(FlyoutViewBase):
 
     def set_stands(self, stands: list):
         self._stands = stands
-        completer = QCompleter(self._stands)
-        completer.setCaseSensitivity(Qt.CaseInsensitive)
-        completer.setMaxVisibleItems(10)
-        self._searchLineEdit.setCompleter(completer)
+        self._completer.model().setStringList(self._stands)
 
     def closeEvent(self, e):
         """ 关闭事件处理 """
@@ -185,6 +178,10 @@ class ImageCanvas(QFrame):
     WHEEL_ZOOM_FACTOR = 1.2 
     ROTATE_ANGLE = 90
     RESIZE_THRESHOLD = 5 
+    SCALE_CACHE_SIZE = 8  # 本地保留的最近缩放级别数量
+    MIPMAP_LEVELS = 3  # 除原图外预先生成的 1/2、1/4、1/8 缩小图数量
+    REFINE_DELAY = 150  # 交互停止后进行平滑缩放的延迟（毫秒）
+    RESIZE_DELAY = 80  # 尺寸调整停止后进行平滑缩放的延迟（毫秒）
 
 
     scaleSignal = pyqtSignal(float)
@@ -193,24 +190,36 @@ class ImageCanvas(QFrame):
         super().__init__(parent)
         self.parent = parent
 
-        self.original_pixmap  = None
+        self.original_image = None  # 原始图像（不透明时为 RGB32，否则为预乘 ARGB32），仅在绘制结果时转换为 QPixmap
+        self._mipmaps = []  # 缩小图金字塔，第 0 级为原始图像，之后每级尺寸减半
         self._scaled_pixmap = None 
+        self._scaled_scale = 0  # 生成 _scaled_pixmap 时的缩放比例
+        self._scaled_origin = QPoint(0, 0)  # 缩放图像左上角相对于 offset 的位置（只缩放可见区域时非零）
+        self._scale_cache = LRUCache(self.SCALE_CACHE_SIZE)  # 最近缩放级别的本地缓存，避免被全局缓存淘汰
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), SCALED_PIXMAP_CACHE_LIMIT))  # 仅在全局缓存容量不足时提高
 
         self._scale = 1.0 
 
-        self.offset = QPoint(0, 0)
+        self._paint_pos = QPointF(0, 0)  # 缩放图像的绘制位置，随 offset 更新，避免每帧创建 QPointF
+        self._offset = QPoint(0, 0)
         self.dragging = False 
         self.last_pos = QPoint()
         self.last_canvas_size = self.size()
 
-        self.original_pixmap_w_h = None
+        self.original_image_w_h = None
         self.total_rotate_angle = 0
 
+        self._refine_timer = QTimer(self)  # 交互停止后执行平滑缩放
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.timeout.connect(self._refine_scaled)
+
         self.setFocusPolicy(Qt.StrongFocus)
         self._scale_label  = ScaleLabel(self)
 
         self.scaleSignal.connect(self._scale_label.show_scale)
 
+        self._draw = self._draw_nothing  # 绘制函数，只在加载图像时切换，paintEvent 中无需判断是否有图像
+
     @property
     def scale(self):
         return self._scale
@@ -220,17 +229,42 @@ class ImageCanvas(QFrame):
         self._scale = value
         self.scaleSignal.emit(value)
 
+    @property
+    def offset(self):
+        return self._offset
+
+    @offset.setter
+    def offset(self, value: QPoint):
+        self._offset = value
+        self._update_paint_pos()
+
+    def _update_paint_pos(self):
+        """同步缩放图像的绘制位置"""
+        self._paint_pos.setX(self._offset.x() + self._scaled_origin.x())
+        self._paint_pos.setY(self._offset.y() + self._scaled_origin.y())
+
     def load_pixmap(self, pixmap: QPixmap):
+        self.load_qimage(pixmap.toImage())
+
+    def load_qimage(self, image: QImage):
 
-        self.original_pixmap = pixmap if not pixmap.isNull() else None
+        if not image.isNull():
+            # 没有透明通道的图像（如 JPEG）使用 RGB32，缩放时走无需处理 alpha 的快速路径
+            image_format = QImage.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format_RGB32
+            image = image.convertToFormat(image_format)
+
+        self.original_image = image if not image.isNull() else None
         self._scaled_pixmap = None
+        self._scale_cache.clear()
+        self._build_mipmaps()
+        self._draw = self._draw_image if self.original_image else self._draw_nothing
 
-        if self.original_pixmap:
+        if self.original_image:
 
-            self.original_pixmap_w_h = QSize(self.original_pixmap.width(), self.original_pixmap.height())
+            self.original_image_w_h = QSize(self.original_image.width(), self.original_image.height())
 
             self.init_load_image()    
-            self.update_scaled_image()
+            self._refine_timer.start(0)
 
         self.update()
 
@@ -238,24 +272,23 @@ class ImageCanvas(QFrame):
     def center_image(self):
         """居中显示图像"""
         self.init_load_image()    
-        self.update_scaled_image()
+        self._refine_timer.start(0)
         self.update()
         
 
     def load_image(self, image_path: str):
-        pixmap = QPixmap(image_path)
-        self.load_pixmap(pixmap)
+        self.load_qimage(QImage(image_path))
 
 
     def init_load_image(self):
         """初始化图像加载：计算初始缩放比例和居中偏移"""
-        if not self.original_pixmap or self.width() <= 0 or self.height() <= 0:
+        if not self.original_image or self.width() <= 0 or self.height() <= 0:
             self.scale = 1.0
             self.offset = QPoint(0, 0)
             return
         
         canvas_w, canvas_h = self.width(), self.height()
-        img_w, img_h = self.original_pixmap.width(), self.original_pixmap.height()
+        img_w, img_h = self.original_image.width(), self.original_image.height()
         scale_w = canvas_w / img_w
         scale_h = canvas_h / img_h
         self.scale = min(scale_w, scale_h)
@@ -268,35 +301,134 @@ class ImageCanvas(QFrame):
             (canvas_h - scaled_h) // 2
         )
 
+    def _build_mipmaps(self):
+        """生成缩小图金字塔，缩小显示时从最接近的一级开始缩放，减少扫描的源像素"""
+        self._mipmaps = [self.original_image] if self.original_image else []
+
+        for _ in range(self.MIPMAP_LEVELS):
+            base = self._mipmaps[-1] if self._mipmaps else None
+            if base is None or base.width() < 2 or base.height() < 2:
+                break
+            self._mipmaps.append(base.scaled(base.width() // 2, base.height() // 2,
+                                             Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+
+    def _mip_level(self) -> int:
+        """当前缩放比例对应的金字塔级别，保证从该级别出发仍是缩小（或原样）"""
+        if self.scale >= 1 or len(self._mipmaps) <= 1:
+            return 0
+        return min(len(self._mipmaps) - 1, max(0, int(-math.log2(self.scale))))
+
+    def _image_rect(self) -> QRect:
+        """缩放后的整张图像在画布中的区域"""
+        img_w, img_h = self.original_image.width(), self.original_image.height()
+        return QRect(self.offset, QSize(int(img_w * self.scale), int(img_h * self.scale)))
+
+    def _is_view_covered(self) -> bool:
+        """当前缩放图像是否覆盖了画布中图像的可见区域"""
+        if not self.original_image:
+            return True
+
+        visible = self.rect().intersected(self._image_rect())
+        if visible.isEmpty():
+            return True
+
+        if not self._scaled_pixmap:
+            return False
+
+        return QRect(self.offset + self._scaled_origin, self._scaled_pixmap.size()).contains(visible)
+
     def update_scaled_image(self):
+        """更新平滑缩放后的图像，图像超出画布时只缩放可见区域"""
+        self._scaled_pixmap = None
+        self._scaled_scale = self.scale
+        self._scaled_origin = QPoint(0, 0)
+        self._update_paint_pos()
 
-        if not self.original_pixmap:
-            self._scaled_pixmap = None
+        if not self.original_image:
             return
         
-        img_w, img_h = self.original_pixmap.width(), self.original_pixmap.height()
-        scaled_w = int(img_w * self.scale)
-        scaled_h = int(img_h * self.scale)
+        img_w, img_h = self.original_image.width(), self.original_image.height()
+        image_rect = self._image_rect()
    
-        if scaled_w <= 0 or scaled_h <= 0:
-            self._scaled_pixmap = None
+        if image_rect.isEmpty():
             return
 
-        self._scaled_pixmap = self.original_pixmap.scaled(
-            scaled_w, scaled_h,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        visible = self.rect().intersected(image_rect)
+        if visible.isEmpty():
+            return
+
+        if visible == image_rect:
+            # 图像完整可见，缩放整张图像
+            src_rect = QRect(0, 0, img_w, img_h)
+            size = image_rect.size()
+        else:
+            # 将可见区域映射回原始图像坐标，只缩放这一部分
+            x0 = max(0, math.floor((visible.left() - self.offset.x()) / self.scale))
+            y0 = max(0, math.floor((visible.top() - self.offset.y()) / self.scale))
+            x1 = min(img_w, math.ceil((visible.right() + 1 - self.offset.x()) / self.scale))
+            y1 = min(img_h, math.ceil((visible.bottom() + 1 - self.offset.y()) / self.scale))
+            src_rect = QRect(x0, y0, x1 - x0, y1 - y0)
+            self._scaled_origin = QPoint(round(x0 * self.scale), round(y0 * self.scale))
+            self._update_paint_pos()
+            size = QSize(max(1, round(x1 * self.scale) - self._scaled_origin.x()),
+                         max(1, round(y1 * self.scale) - self._scaled_origin.y()))
+
+        # 先查本地缓存，再查全局 QPixmapCache，都未命中时才重新缩放
+        key = (f"image_canvas_{self.original_image.cacheKey()}_{src_rect.x()}_{src_rect.y()}_{src_rect.width()}_"
+               f"{src_rect.height()}_{size.width()}_{size.height()}_{self.total_rotate_angle}")
+        pixmap = self._scale_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmapCache.find(key)
+
+        if pixmap is not None:
+            self._scale_cache.put(key, pixmap)
+            self._scaled_pixmap = pixmap
+            return
+
+        source = self._mipmaps[self._mip_level()]
+        if source is not self.original_image:
+            # 将原始图像坐标映射到所选级别的坐标
+            fx, fy = source.width() / img_w, source.height() / img_h
+            x0, y0 = math.floor(src_rect.left() * fx), math.floor(src_rect.top() * fy)
+            x1 = min(source.width(), max(x0 + 1, math.ceil((src_rect.right() + 1) * fx)))
+            y1 = min(source.height(), max(y0 + 1, math.ceil((src_rect.bottom() + 1) * fy)))
+            src_rect = QRect(x0, y0, x1 - x0, y1 - y0)
+
+        if src_rect != source.rect():
+            source = source.copy(src_rect)
+
+        if size == source.size():
+            image = source  # 缩放比例为1，无需缩放
+        else:
+            image = source.scaled(size, Qt.IgnoreAspectRatio, self._transformation_mode())
+
+        pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion)
+        QPixmapCache.insert(key, pixmap)
+        self._scale_cache.put(key, pixmap)
+        self._scaled_pixmap = pixmap
+
+    def _transformation_mode(self) -> Qt.TransformationMode:
+        """整数倍放大时使用最近邻插值（即像素复制），保持像素清晰且比平滑插值快得多"""
+        ratio = round(self.scale)
+        if ratio >= 1 and abs(self.scale - ratio) < 1e-3:
+            return Qt.FastTransformation
+
+        return Qt.SmoothTransformation
+
+    def _refine_scaled(self):
+        """交互停止后使用平滑缩放重新生成图像"""
+        self.update_scaled_image()
+        self.update()
 
     def _update_zoom_offset(self, scale_factor: float, center_pos: QPoint):
-        if not self.original_pixmap:
+        if not self.original_image:
             return
 
        
         old_scale = self.scale
 
-        self.scale *= scale_factor
-        self.scale = max(self.MIN_SCALE, min(self.scale, self.MAX_SCALE))
+        # 先计算并限制新的缩放比例，只赋值一次，避免重复发送 scaleSignal
+        self.scale = max(self.MIN_SCALE, min(old_scale * scale_factor, self.MAX_SCALE))
 
         # 计算缩放中心点在「原始图像坐标系」中的位置（关键：坐标转换）
         img_x = (center_pos.x() - self.offset.x()) / old_scale
@@ -307,13 +439,14 @@ class ImageCanvas(QFrame):
         new_offset_y = int(center_pos.y() - img_y * self.scale)
         self.offset = QPoint(new_offset_x, new_offset_y)
 
-        self.update_scaled_image()
+        # 交互过程中由 paintEvent 直接缩放绘制，停止后再生成平滑缩放图像
+        self._refine_timer.start(self.REFINE_DELAY)
         self.update()
         
 
 
     def zoom_to(self, scale_factor: float):
-        if not self.original_pixmap:
+        if not self.original_image:
             return
         center_pos = self.rect().center() # 缩放中心点：画布中心
         self._update_zoom_offset(scale_factor, center_pos)
@@ -327,32 +460,46 @@ class ImageCanvas(QFrame):
     
     def rotate_image(self):
 
-        if not self.original_pixmap:
+        if not self.original_image:
             return
 
+        # 旋转角度为90°的整数倍，只是像素的重新排列，不需要插值
         transform = QTransform().rotate(self.ROTATE_ANGLE)
-        self.original_pixmap = self.original_pixmap.transformed(transform, Qt.SmoothTransformation)
+        self.original_image = self.original_image.transformed(transform, Qt.FastTransformation)
+        self._mipmaps = [image.transformed(transform, Qt.FastTransformation) for image in self._mipmaps[1:]]
+        self._mipmaps.insert(0, self.original_image)
         
         self.total_rotate_angle += self.ROTATE_ANGLE
         self.total_rotate_angle %= 360  # 角度归一化（0-359）
 
-
+        self._scaled_pixmap = None
         self.init_load_image()
-        self.update_scaled_image()
+        self._refine_timer.start(0)
         self.update()
 
 
     def paintEvent(self, event):
         painter = QPainter(self)
 
-        painter.setRenderHints(
-            QPainter.TextAntialiasing |
-            QPainter.HighQualityAntialiasing |
-            QPainter.SmoothPixmapTransform
-        )
-        
-        if self._scaled_pixmap:
-            painter.drawPixmap(QPointF(self.offset.x(), self.offset.y()),self._scaled_pixmap)
+        # 只绘制图像，仅需平滑变换；HighQualityAntialiasing 已弃用且会使绘制引擎退回慢速路径
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        self._draw(painter)
+
+    def _draw_nothing(self, painter: QPainter):
+        """未加载图像时不绘制任何内容"""
+
+    def _draw_image(self, painter: QPainter):
+        """绘制图像：优先使用平滑缩放后的图像"""
+        if self._scaled_pixmap and self._scaled_scale == self.scale and self._is_view_covered():
+            painter.drawPixmap(self._paint_pos, self._scaled_pixmap)
+            return
+
+        # 平滑缩放图像尚未就绪（交互中或等待空闲），由画家直接缩放绘制原始图像
+        source = self._mipmaps[self._mip_level()]
+        painter.translate(self.offset.x(), self.offset.y())
+        painter.scale(self.scale * self.original_image.width() / source.width(),
+                      self.scale * self.original_image.height() / source.height())
+        painter.drawImage(0, 0, source)
 
     def mousePressEvent(self, event):
         """
@@ -360,12 +507,12 @@ class ImageCanvas(QFrame):
 
         :param event: 鼠标事件对象。
         """
-        if event.button() == Qt.RightButton:
-            self.dragging = True
-            self.last_pos = event.pos() 
+        if event.button() != Qt.RightButton:
+            super().mousePressEvent(event)
             return
 
-        super().mousePressEvent(event)
+        self.dragging = True
+        self.last_pos = event.pos() 
 
 
     def mouseMoveEvent(self, event):
@@ -374,15 +521,18 @@ class ImageCanvas(QFrame):
 
         :param event: 鼠标事件对象。
         """
-        if self.dragging and self.original_pixmap  is not None:
-            delta = event.pos() - self.last_pos 
-            self.offset += delta  # 更新图像显示的偏移量
-            self.last_pos = event.pos()  # 记录当前鼠标位置
-            self.update()
+        if not self.dragging or self.original_image is None:
+            super().mouseMoveEvent(event)
             return
-    
 
-        super().mouseMoveEvent(event)
+        delta = event.pos() - self.last_pos 
+        self.offset += delta  # 更新图像显示的偏移量
+        self.last_pos = event.pos()  # 记录当前鼠标位置
+
+        if not self._is_view_covered():  # 拖动露出了未缩放的区域，停止后重新生成
+            self._refine_timer.start(self.REFINE_DELAY)
+
+        self.update()
 
     def mouseReleaseEvent(self, event):
         """
@@ -390,15 +540,15 @@ class ImageCanvas(QFrame):
 
         :param event: 鼠标事件对象。
         """
-        if event.button() == Qt.RightButton and self.dragging :
-            self.dragging = False 
+        if event.button() != Qt.RightButton or not self.dragging:
+            super().mouseReleaseEvent(event)
             return
-           
-        super().mouseReleaseEvent(event)
+
+        self.dragging = False 
 
     def wheelEvent(self, event):
         """处理鼠标滚轮事件：以鼠标位置为中心缩放"""
-        if not self.original_pixmap:
+        if not self.original_image:
             super().wheelEvent(event)
             return
 
@@ -416,13 +566,16 @@ class ImageCanvas(QFrame):
         height_diff = abs(current_size.height() - self.last_canvas_size.height())
     
         if width_diff < self.RESIZE_THRESHOLD and height_diff < self.RESIZE_THRESHOLD:
+            if not self._is_view_covered():  # 画布变大露出了未缩放的区域
+                self._refine_timer.start(self.RESIZE_DELAY)
             super().resizeEvent(event)
             return
 
         self._scale_label.move_scale_label()
-        if self.original_pixmap:
+        if self.original_image:
+            # 连续调整尺寸时只重新计算缩放比例，由 paintEvent 直接缩放绘制，停止后再平滑缩放一次
             self.init_load_image()
-            self.update_scaled_image()
+            self._refine_timer.start(self.RESIZE_DELAY)
             self.update()
 
         self.last_canvas_size = current_size
@@ -1,18 +1,22 @@
 # coding:utf-8
 from enum import Enum
+from functools import partial
 import sys
 from typing import Union
 import weakref
 
+from PyQt5 import sip
 from PyQt5.QtCore import (Qt, QEvent, QSize, QRectF, QObject, QPropertyAnimation,
                           QEasingCurve, QTimer, pyqtSignal, QParallelAnimationGroup, QPoint)
-from PyQt5.QtGui import QPainter, QIcon, QColor
+from PyQt5.QtGui import QPainter, QIcon, QColor, QPixmap, QBrush
 from PyQt5.QtWidgets import (QWidget, QFrame, QLabel, QHBoxLayout, QVBoxLayout,
                              QToolButton, QGraphicsOpacityEffect, QApplication)
 
 from ...common.auto_wrap import TextWrap
+from ...common.cache import LRUCache
 from ...common.style_sheet import FluentStyleSheet, themeColor
-from ...common.icon import FluentIconBase, Theme, isDarkTheme,drawIcon
+from ...common.icon import FluentIconBase, Theme, drawIcon
+from ...common.config import isDarkTheme
 from ...common.icon import FluentIcon as FIF
 
 from ..widgets.button import TransparentToolButton
@@ -43,8 +47,14 @@ class InfoBarIcon(FluentIconBase, Enum):
             # 手动指定主题时，直接使用对应主题值
             color = theme.value.lower()
 
-        # 返回拼接后的图标路径（基于资源文件）
-        return f':/resource/images/info_bar/{self.value}_{color}.svg'
+        # 返回预先拼接好的图标路径（基于资源文件），避免每次绘制都格式化字符串
+        return _INFO_BAR_ICON_PATHS[(self, color)]
+
+
+_INFO_BAR_ICON_PATHS = {
+    (icon, color): f':/resource/images/info_bar/{icon.value}_{color}.svg'
+    for icon in InfoBarIcon for color in ('light', 'dark')
+}
 
 
 class InfoBarPosition(Enum):
@@ -58,6 +68,9 @@ class InfoBarPosition(Enum):
     NONE = 6                    # 无预设位置（自定义定位）
 
 
+_ICON_PIXMAP_CACHE = LRUCache(16)  # 所有信息栏共享的图标位图，键为 (图标, 是否深色主题, 填充色, 设备像素比)
+
+
 class InfoIconWidget(QWidget):
     """ 信息栏图标部件，用于在信息栏中显示指定图标 """
 
@@ -73,6 +86,9 @@ class InfoIconWidget(QWidget):
         self.setFixedSize(36, 36)  # 设置部件固定大小为36x36像素
         self.icon = icon            # 保存图标类型
 
+        self._iconPixmap = None     # 缓存的图标位图，避免每次重绘都重新渲染 SVG
+        self._iconPixmapKey = None  # 生成缓存时的 (是否深色主题, 填充色, 设备像素比)
+
     def paintEvent(self, e):
         """
         重写绘制事件，绘制图标
@@ -81,17 +97,49 @@ class InfoIconWidget(QWidget):
             e: QPaintEvent，绘制事件对象
         """
         painter = QPainter(self)    # 创建画家对象
+        painter.drawPixmap(0, 0, self._pixmap())
+
+    def _pixmap(self) -> QPixmap:
+        """ 获取图标位图，主题、主题色或设备像素比变化时重新渲染 """
+        fill = themeColor().name() if self.icon == InfoBarIcon.INFORMATION else None
+        dpr = self.devicePixelRatioF()
+        key = (isDarkTheme(), fill, dpr)
+        if self._iconPixmap is not None and key == self._iconPixmapKey:
+            return self._iconPixmap
+
+        # 枚举和路径字符串形式的图标可以安全地作为键，在多个信息栏之间共享渲染结果
+        sharedKey = (self.icon, *key) if isinstance(self.icon, (Enum, str)) else None
+        pixmap = _ICON_PIXMAP_CACHE.get(sharedKey) if sharedKey else None
+        if pixmap is None:
+            pixmap = self._renderPixmap(fill, dpr)
+            if sharedKey:
+                _ICON_PIXMAP_CACHE.put(sharedKey, pixmap)
+
+        self._iconPixmap = pixmap
+        self._iconPixmapKey = key
+        return pixmap
+
+    def _renderPixmap(self, fill, dpr) -> QPixmap:
+        """ 将图标渲染为位图 """
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         # 设置画家渲染提示：抗锯齿和平滑像素变换
         painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
 
         # 定义图标绘制区域（矩形）：x=10, y=10, 宽=15, 高=15
         rect = QRectF(10, 10, 15, 15)
-        if self.icon != InfoBarIcon.INFORMATION:
+        if fill is None:
             # 非信息类型图标，直接绘制
             drawIcon(self.icon, painter, rect)
         else:
             # 信息类型图标，使用主题色填充（indexes=[0]指定SVG中需要填充的路径索引）
-            drawIcon(self.icon, painter, rect, indexes=[0], fill=themeColor().name())
+            drawIcon(self.icon, painter, rect, indexes=[0], fill=fill)
+
+        painter.end()
+        return pixmap
 
 
 class InfoBar(QFrame):
@@ -99,6 +147,9 @@ class InfoBar(QFrame):
 
     closedSignal = pyqtSignal()  # 信息栏关闭时发出的信号
     _desktopView = None          # 桌面级信息栏容器（静态变量）
+    _wrapCache = LRUCache(64)    # 换行结果缓存，键为 (文本, 每行字符数)，所有信息栏共享
+    _sizeCache = LRUCache(64)    # 信息栏尺寸缓存，键为换行后的文本、字体和布局选项
+    _ADJUST_EVENTS = frozenset({QEvent.Resize, QEvent.WindowStateChange})  # 需要重新调整文本的父部件事件
 
     def __init__(self, icon: Union[InfoBarIcon, FluentIconBase, QIcon, str], title: str, content: str,
                  orient=Qt.Horizontal, isClosable=True, duration=1000, position=InfoBarPosition.TOP_RIGHT,
@@ -113,37 +164,47 @@ class InfoBar(QFrame):
         self.isClosable = isClosable    
         self.position = position     
 
-        self.titleLabel = QLabel(self)  
-        self.contentLabel = QLabel(self) 
-        self.closeButton = TransparentToolButton(FIF.CLOSE, self)
-        self.iconWidget = InfoIconWidget(icon) 
+        # 只创建需要显示的子部件，没有标题、内容、关闭按钮或图标时对应属性为 None
+        self.titleLabel = QLabel(self) if title else None
+        self.contentLabel = QLabel(self) if content else None
+        self.closeButton = TransparentToolButton(FIF.CLOSE, self) if isClosable else None
+        self.iconWidget = InfoIconWidget(icon) if icon is not None else None
 
         self.hBoxLayout = QHBoxLayout(self)   
         self.textLayout = QHBoxLayout() if self.orient == Qt.Horizontal else QVBoxLayout()
 
-        self.opacityEffect = QGraphicsOpacityEffect(self)  # 透明度效果对象
-        self.opacityAni = QPropertyAnimation(self.opacityEffect, b'opacity', self)
+        self.opacityEffect = None  # 透明度效果对象，淡出时才创建并安装
+        self.opacityAni = None     # 淡出动画，淡出时才创建
 
         self.lightBackgroundColor = None  
         self.darkBackgroundColor = None 
+        self._backgroundBrushes = None  # 自定义背景画刷 (浅色, 深色)，设置背景色时创建一次
+
+        self._lastWrapKey = None  # 上次换行时的 (标题, 内容, 标题字符数, 内容字符数)
+        self._lastTextWidth = None  # 上次调整文本时的可用宽度
+
+        if parent is None:
+            # 没有父部件时可用宽度固定，也不会收到父部件的尺寸变化事件，换行一次即可
+            self._adjustText = self._adjustTextFixed
+
+        self._adjustTimer = QTimer(self)  # 合并父部件连续的尺寸变化事件，在下一次事件循环中只调整一次文本
+        self._adjustTimer.setSingleShot(True)
+        self._adjustTimer.setInterval(0)
+        self._adjustTimer.timeout.connect(self._adjustText)
 
         self.__initWidget()  # 初始化界面部件
 
     def __initWidget(self):
-        """ 初始化界面部件（设置透明度、按钮样式、布局等） """
-        self.opacityEffect.setOpacity(1) 
-        self.setGraphicsEffect(self.opacityEffect)  # 为部件应用透明度效果
-
-        self.closeButton.setFixedSize(36, 36)   
-        self.closeButton.setIconSize(QSize(12, 12)) 
-        self.closeButton.setCursor(Qt.PointingHandCursor)
-        self.closeButton.setVisible(self.isClosable) 
+        """ 初始化界面部件（设置按钮样式、布局等） """
+        if self.closeButton:
+            self.closeButton.setFixedSize(36, 36)   
+            self.closeButton.setIconSize(QSize(12, 12)) 
+            self.closeButton.setCursor(Qt.PointingHandCursor)
+            self.closeButton.clicked.connect(self.close)  
 
         self.__setQss()  
         self.__initLayout() 
 
-        self.closeButton.clicked.connect(self.close)  
-
     def __initLayout(self):
         """ 初始化布局（设置边距、间距、添加部件到布局） """
         self.hBoxLayout.setContentsMargins(6, 6, 6, 6) 
@@ -155,30 +216,34 @@ class InfoBar(QFrame):
         self.hBoxLayout.setSpacing(0) 
         self.textLayout.setSpacing(5)  
 
-        self.hBoxLayout.addWidget(self.iconWidget, 0, Qt.AlignTop | Qt.AlignLeft)
-
-        self.textLayout.addWidget(self.titleLabel, 1, Qt.AlignTop)
+        if self.iconWidget:
+            self.hBoxLayout.addWidget(self.iconWidget, 0, Qt.AlignTop | Qt.AlignLeft)
 
-        self.titleLabel.setVisible(bool(self.title)) # 标题标签是否可见（根据是否有标题文本）
+        if self.titleLabel:
+            self.textLayout.addWidget(self.titleLabel, 1, Qt.AlignTop)
 
         if self.orient == Qt.Horizontal:
             self.textLayout.addSpacing(7)
 
-        self.textLayout.addWidget(self.contentLabel, 1, Qt.AlignTop)
-        self.contentLabel.setVisible(bool(self.content)) # 内容标签是否可见（根据是否有内容文本）
+        if self.contentLabel:
+            self.textLayout.addWidget(self.contentLabel, 1, Qt.AlignTop)
+
         self.hBoxLayout.addLayout(self.textLayout) 
 
 
         self.hBoxLayout.addSpacing(12)  # 主布局添加12像素间距
         # 添加关闭按钮到主布局（顶部左对齐）
-        self.hBoxLayout.addWidget(self.closeButton, 0, Qt.AlignTop | Qt.AlignLeft)
+        if self.closeButton:
+            self.hBoxLayout.addWidget(self.closeButton, 0, Qt.AlignTop | Qt.AlignLeft)
 
         self._adjustText()  # 调整文本显示（自动换行）
 
     def __setQss(self):
         """ 设置样式表（通过对象名和属性让样式表生效） """
-        self.titleLabel.setObjectName('titleLabel')    # 设置标题标签对象名（用于QSS选择）
-        self.contentLabel.setObjectName('contentLabel')  # 设置内容标签对象名
+        if self.titleLabel:
+            self.titleLabel.setObjectName('titleLabel')    # 设置标题标签对象名（用于QSS选择）
+        if self.contentLabel:
+            self.contentLabel.setObjectName('contentLabel')  # 设置内容标签对象名
         if isinstance(self.icon, Enum):
             # 如果图标是枚举类型，设置type属性为枚举值（用于QSS根据类型设置不同样式）
             self.setProperty('type', self.icon.value)
@@ -187,6 +252,18 @@ class InfoBar(QFrame):
 
     def __fadeOut(self):
         """ 淡出动画（信息栏关闭前的渐隐效果） """
+        if self.opacityAni:
+            return  # 已经在淡出
+
+        # 透明度效果每次绘制都要经过离屏缓冲区合成，因此只在淡出期间使用；顶层窗口直接改变窗口透明度
+        # 从未淡出的信息栏（如手动关闭）不会创建这两个对象
+        if self.isWindow():
+            self.opacityAni = QPropertyAnimation(self, b'windowOpacity', self)
+        else:
+            self.opacityEffect = QGraphicsOpacityEffect(self)
+            self.setGraphicsEffect(self.opacityEffect)
+            self.opacityAni = QPropertyAnimation(self.opacityEffect, b'opacity', self)
+
         self.opacityAni.setDuration(200)  # 动画时长200毫秒
         self.opacityAni.setStartValue(1)  # 起始透明度1（不透明）
         self.opacityAni.setEndValue(0)    # 结束透明度0（完全透明）
@@ -195,28 +272,82 @@ class InfoBar(QFrame):
 
     def _adjustText(self):
         """ 调整文本显示（自动换行，限制最大宽度） """
-        w = 900 if not self.parent() else (self.parent().width() - 50)
+        parent = self.parent()
+        self._adjustTextWidth(900 if not parent else (parent.width() - 50))
+
+    def _adjustTextFixed(self):
+        """ 没有父部件时调整文本显示：可用宽度固定，只在尚未换行（或显示时被重置）时执行 """
+        if self._lastWrapKey is None:
+            self._adjustTextWidth(900)
+
+    def _adjustTextWidth(self, w: int):
+        """ 按可用宽度 w 自动换行并调整大小 """
+        # 可用宽度没有变化（如窗口状态变化但尺寸不变）时直接返回
+        if w == self._lastTextWidth and self._lastWrapKey is not None:
+            return
+
+        self._lastTextWidth = w
 
-        chars = max(min(w / 10, 120), 30)
-        self.titleLabel.setText(TextWrap.wrap(self.title, chars, False)[0])
+        # 每行字符数按 8 向下取整，连续调整窗口大小时只有跨过分档才需要重新换行
+        titleChars = max(min(int(w // 10) & ~7, 120), 30)
+        contentChars = max(min(int(w // 9) & ~7, 120), 30)
+
+        # 每行字符数没有变化时换行结果相同，无需重新设置文本和调整大小
+        key = (self.title, self.content, titleChars, contentChars)
+        if key == self._lastWrapKey:
+            return
+
+        self._lastWrapKey = key
+        if self.titleLabel:
+            self.titleLabel.setText(self._wrap(self.title, titleChars))
+        if self.contentLabel:
+            self.contentLabel.setText(self._wrap(self.content, contentChars))
+        self._adjustSize() # 调整部件大小以适应文本内容
+
+    def _adjustSize(self):
+        """ 调整部件大小以适应文本内容，相同文本和布局的信息栏直接复用之前计算的尺寸 """
+        labels = [label for label in (self.titleLabel, self.contentLabel) if label]
+        key = (tuple((label.text(), label.font().key()) for label in labels),
+               self.orient, self.closeButton is not None, self.iconWidget is not None)
+
+        size = self._sizeCache.get(key)
+        if size is None:
+            self.adjustSize()
+            self._sizeCache.put(key, self.size())
+        else:
+            self.resize(size)
+
+    @classmethod
+    def _wrap(cls, text: str, chars: int) -> str:
+        """ 对文本自动换行，结果按 (文本, 每行字符数) 缓存 """
+        key = (text, chars)
+        wrapped = cls._wrapCache.get(key)
+        if wrapped is None:
+            wrapped = TextWrap.wrap(text, chars, False)[0]
+            cls._wrapCache.put(key, wrapped)
 
-        chars = max(min(w / 9, 120), 30)
-        self.contentLabel.setText(TextWrap.wrap(self.content, chars, False)[0])
-        self.adjustSize() # 调整部件大小以适应文本内容
+        return wrapped
 
 
     def setCustomBackgroundColor(self, light, dark):
         self.lightBackgroundColor = QColor(light)  # 转换为QColor并保存
         self.darkBackgroundColor = QColor(dark)
+        self._backgroundBrushes = (QBrush(self.lightBackgroundColor), QBrush(self.darkBackgroundColor))
         self.update()  # 触发重绘以应用新背景色
 
     def eventFilter(self, obj, e: QEvent):
-        if obj is self.parent():
-            # 父部件调整大小或窗口状态变化时，重新调整文本
-            if e.type() in [QEvent.Resize, QEvent.WindowStateChange]:
-                self._adjustText()
+        # 父部件的所有事件都会经过这里，先按事件类型过滤掉绝大多数无关事件
+        t = e.type()
+        if t not in InfoBar._ADJUST_EVENTS or obj is not self.parent():
+            return False
+
+        # 父部件调整大小或窗口状态变化时，重新调整文本
+        if t == QEvent.Resize:
+            self._adjustTimer.start()
+        else:
+            self._adjustText()
 
-        return super().eventFilter(obj, e)  # 调用父类实现
+        return False  # 不拦截事件，与 QObject.eventFilter 的默认行为一致
 
     def closeEvent(self, e):
        
@@ -225,19 +356,26 @@ class InfoBar(QFrame):
         e.ignore()  # 忽略事件（由deleteLater处理）
 
     def showEvent(self, e):
-
-        self._adjustText()  # 显示前调整文本
         super().showEvent(e)  # 调用父类显示事件
 
-        # 显示时长>=0时，启动定时器，到时后执行淡出动画
-        if self.duration >= 0:
-            QTimer.singleShot(self.duration, self.__fadeOut) # 启动定时器，到时后执行淡出动画
+        # 尺寸和滑入位置决定第一帧的显示效果，必须在绘制前完成
+        self._lastWrapKey = None  # 显示时样式表已生效，字体可能变化，需要重新调整大小
+        self._adjustText()
 
         # 非NONE位置时，通过InfoBarManager管理位置和动画
         if self.position != InfoBarPosition.NONE:
             manager = InfoBarManager.make(self.position)
             manager.add(self)
 
+        # 其余不影响第一帧的工作推迟到下一次事件循环
+        QTimer.singleShot(0, self.__postShowSetup)
+
+    def __postShowSetup(self):
+        """ 显示后的设置：启动自动关闭定时器，监听父部件尺寸变化 """
+        # 显示时长>=0时，启动定时器，到时后执行淡出动画
+        if self.duration >= 0:
+            QTimer.singleShot(self.duration, self.__fadeOut) # 启动定时器，到时后执行淡出动画
+
         if self.parent():
             self.parent().installEventFilter(self)
 
@@ -245,17 +383,14 @@ class InfoBar(QFrame):
 
         super().paintEvent(e) 
 
-        if self.lightBackgroundColor is None:
+        if self._backgroundBrushes is None:
             return 
 
         painter = QPainter(self) 
         painter.setRenderHints(QPainter.Antialiasing)  
         painter.setPen(Qt.NoPen)
 
-        if isDarkTheme():
-            painter.setBrush(self.darkBackgroundColor)
-        else:
-            painter.setBrush(self.lightBackgroundColor)
+        painter.setBrush(self._backgroundBrushes[isDarkTheme()])  # 按主题选择预先创建的画刷
 
         rect = self.rect().adjusted(1, 1, -1, -1)
         painter.drawRoundedRect(rect, 6, 6) 
@@ -301,32 +436,39 @@ class InfoBar(QFrame):
             DesktopInfoBarView: 桌面级容器实例（用于在桌面显示信息栏）
         """
         if not cls._desktopView:
-            cls._desktopView = DesktopInfoBarView()
-            cls._desktopView.show()  # 首次调用时创建并显示容器
+            cls._desktopView = DesktopInfoBarView()  # 首次调用时创建容器
+
+        if cls._desktopView.isHidden():
+            cls._desktopView.show()  # 没有信息栏时容器会自动隐藏，使用前重新显示
 
         return cls._desktopView
 
 class InfoBarManager(QObject):
  
     _instance = None
-    managers = {}
+    managers = [None] * len(InfoBarPosition)  # 按 InfoBarPosition 的值索引的管理器类
 
     def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super(InfoBarManager, cls).__new__(
-                cls, *args, **kwargs)
-            cls._instance.__initialized = False
+        # 每个管理器子类各自保存单例，只查找本类的 __dict__，避免继承到父类或其他子类的实例
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.__initialized = False
+            cls._instance = instance
 
-        return cls._instance
+        return instance
 
     def __init__(self):
-        super().__init__()
+        # 单例只初始化一次，重复调用 QObject.__init__ 会重新创建底层对象并丢失已有的子对象
         if self.__initialized:
             return
 
+        super().__init__()
+
         self.margin_x = 18
         self.margin_y = 54
-        self.slideAnis = []  # 只保留滑动动画列表
+        self.slideAnis = set()  # 正在运行的滑动动画，集合删除为 O(1)
+        self._slideAniPool = []  # 已停止、可复用的滑动动画
         self.__initialized = True
 
     def add(self, infoBar: InfoBar):
@@ -335,31 +477,52 @@ class InfoBarManager(QObject):
             return
 
         slideAni = self._createSlideAni(infoBar)
-        self.slideAnis.append(slideAni)
+        self.slideAnis.add(slideAni)
 
         infoBar.setProperty('slideAni', slideAni)
 
         slideAni.start()
 
-        #动画结束时，从列表移除
-        slideAni.finished.connect(lambda: self.slideAnis.remove(slideAni))
-
-      
     def _createSlideAni(self, infoBar: InfoBar):
-        slideAni = QPropertyAnimation(infoBar, b'pos')
-        slideAni.setEasingCurve(QEasingCurve.OutQuad)
-        slideAni.setDuration(200)
+        # 优先复用已停止的动画，避免每条信息都创建新的动画对象
+        if self._slideAniPool:
+            slideAni = self._slideAniPool.pop()
+        else:
+            slideAni = QPropertyAnimation(self)
+            slideAni.setPropertyName(b'pos')
+            slideAni.setEasingCurve(QEasingCurve.OutQuad)
+            slideAni.setDuration(200)
+            # 动画结束或因信息栏被销毁而停止时，从集合移除并放回复用池
+            slideAni.stateChanged.connect(partial(self._onSlideAniStateChanged, slideAni))
+
+        slideAni.setTargetObject(infoBar)
 
-        slideAni.setStartValue(self._slideStartPos(infoBar))
-        slideAni.setEndValue(self._pos(infoBar))
+        # 只获取一次父部件尺寸，起点和终点共用
+        parentSize = infoBar.parent().size()
+        endPos = self._pos(infoBar, parentSize)
+        slideAni.setStartValue(self._slideStartPos(infoBar, parentSize, endPos))
+        slideAni.setEndValue(endPos)
 
         return slideAni
 
     
+    def _onSlideAniStateChanged(self, slideAni: QPropertyAnimation, newState, oldState):
+        if newState != QPropertyAnimation.Stopped:
+            return
+
+        self.slideAnis.discard(slideAni)
+
+        # 动画在运行中被销毁（如程序退出时）也会发出停止信号，此时不能再访问或复用
+        if sip.isdeleted(slideAni):
+            return
+
+        slideAni.setTargetObject(None)
+        self._slideAniPool.append(slideAni)
+
     def _pos(self, infoBar: InfoBar, parentSize=None) -> QPoint:
         raise NotImplementedError
 
-    def _slideStartPos(self, infoBar: InfoBar) -> QPoint:
+    def _slideStartPos(self, infoBar: InfoBar, parentSize=None, endPos=None) -> QPoint:
         raise NotImplementedError
 
     
@@ -368,8 +531,8 @@ class InfoBarManager(QObject):
     def register(cls, name):
        
         def wrapper(Manager):
-            if name not in cls.managers:
-                cls.managers[name] = Manager
+            if cls.managers[name.value] is None:
+                cls.managers[name.value] = Manager
 
             return Manager
 
@@ -377,10 +540,11 @@ class InfoBarManager(QObject):
 
     @classmethod
     def make(cls, position: InfoBarPosition):
-        if position not in cls.managers:
+        Manager = cls.managers[position.value] if isinstance(position, InfoBarPosition) else None
+        if Manager is None:
             raise ValueError(f'`{position}` is an invalid animation type.')
 
-        return cls.managers[position]()
+        return Manager()
 
 
 @InfoBarManager.register(InfoBarPosition.TOP_RIGHT)
@@ -389,17 +553,19 @@ class TopRightInfoBarManager(InfoBarManager):
 
     def _pos(self, infoBar: InfoBar, parentSize=None) -> QPoint:
 
-        p = infoBar.parent()
-        parentSize = parentSize or p.size()
+        # 调用方已传入父部件尺寸时不再访问父部件
+        parentSize = parentSize or infoBar.parent().size()
         
         x = parentSize.width() - infoBar.width() - self.margin_x
         y = self.margin_y
 
         return QPoint(x, y)
 
-    def _slideStartPos(self, infoBar: InfoBar):
+    def _slideStartPos(self, infoBar: InfoBar, parentSize=None, endPos=None):
         """滑动起始位置：父部件右侧（从右往左滑入）"""
-        return QPoint(infoBar.parent().width(), self._pos(infoBar).y())
+        parentSize = parentSize or infoBar.parent().size()
+        endPos = endPos or self._pos(infoBar, parentSize)
+        return QPoint(parentSize.width(), endPos.y())
 
 
 class DesktopInfoBarView(QWidget):
@@ -417,5 +583,15 @@ class DesktopInfoBarView(QWidget):
 
         self.setAttribute(Qt.WA_TransparentForMouseEvents)  # 鼠标事件穿透（点击穿透到桌面）
         self.setAttribute(Qt.WA_TranslucentBackground)  # 背景透明
-        # 设置窗口大小为屏幕可用区域（覆盖整个桌面）
-        self.setGeometry(QApplication.primaryScreen().availableGeometry())
+        # 设置窗口大小为屏幕可用区域（覆盖整个桌面），可用区域变化（如任务栏、分辨率调整）时同步更新
+        screen = QApplication.primaryScreen()
+        self.setGeometry(screen.availableGeometry())
+        screen.availableGeometryChanged.connect(self.setGeometry)
+
+    def childEvent(self, e):
+        """ 最后一个信息栏移除后隐藏容器，空闲时不再让覆盖整个桌面的窗口参与合成 """
+        super().childEvent(e)
+        if e.added() and self.isHidden():
+            self.show()  # 直接向已隐藏的容器添加信息栏时重新显示
+        elif e.removed() and not self.findChildren(InfoBar, options=Qt.FindDirectChildrenOnly):
+            self.hide()
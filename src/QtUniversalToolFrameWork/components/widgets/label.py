@@ -1,18 +1,34 @@
 # coding:utf-8
+from math import ceil
 from typing import  Union
 
-from PyQt5.QtCore import Qt, pyqtProperty, pyqtSignal, QSize, QRectF, QUrl
+from PyQt5.QtCore import Qt, pyqtProperty, pyqtSignal, QSize, QRectF, QUrl, QFileInfo
 from PyQt5.QtGui import QPixmap, QPainter, QColor, QFont, QImage, QPainterPath,QImageReader, QMovie, QDesktopServices
 from PyQt5.QtWidgets import QLabel, QWidget, QApplication, QPushButton
 
 from ...common.overload import singledispatchmethod
 from ...common.font import setFont, getFont
-from ...common.style_sheet import FluentStyleSheet, setCustomStyleSheet
-from ...common.config import qconfig, isDarkTheme
+from ...common.style_sheet import FluentStyleSheet, CustomStyleSheet, setCustomStyleSheet
+from ...common.config import isDarkTheme
+from ...common.cache import LRUCache
 
 from .menu import LabelContextMenu
 
-from functools import singledispatchmethod
+
+_IMAGE_CACHE = LRUCache(32)  # 已解码的静态图像，键为 (绝对路径, 修改时间, 文件大小)，同一文件的多个图像标签只解码一次
+
+_BLACK = QColor(0, 0, 0)          # 浅色主题默认文本颜色，与 FluentStyleSheet.LABEL 一致
+_WHITE = QColor(255, 255, 255)    # 深色主题默认文本颜色，与 FluentStyleSheet.LABEL 一致
+_COLOR_NAMES = {}                 # 颜色名称缓存 {rgba: '#AARRGGBB'}，避免重复格式化
+
+
+def _colorName(color: QColor) -> str:
+    """ 获取颜色的 #AARRGGBB 名称，相同颜色只格式化一次 """
+    rgba = color.rgba()
+    name = _COLOR_NAMES.get(rgba)
+    if name is None:
+        name = _COLOR_NAMES[rgba] = color.name(QColor.NameFormat.HexArgb)
+    return name
 
 class PixmapLabel(QLabel):
     """ 高 DPI 像素图标签 """
@@ -20,6 +36,8 @@ class PixmapLabel(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.__pixmap = QPixmap()
+        self._scaledPixmap = None   # 缓存的缩放到控件物理像素尺寸的像素图
+        self._scaledKey = None
 
     def setPixmap(self, pixmap: QPixmap):
         self.__pixmap = pixmap
@@ -33,11 +51,22 @@ class PixmapLabel(QLabel):
         if self.__pixmap.isNull():
             return super().paintEvent(e)
 
+        # 轴对齐的矩形贴图无需抗锯齿，像素图已预先缩放，也无需平滑变换
         painter = QPainter(self)
-        painter.setRenderHints(QPainter.Antialiasing |
-                               QPainter.SmoothPixmapTransform)
-        painter.setPen(Qt.NoPen)
-        painter.drawPixmap(self.rect(), self.__pixmap)
+        painter.drawPixmap(self.rect(), self._scaledToDevice())
+
+    def _scaledToDevice(self) -> QPixmap:
+        """ 获取缩放到控件物理像素尺寸的像素图，仅在像素图、尺寸或设备像素比变化时重新缩放 """
+        size = self.size() * self.devicePixelRatioF()
+        if self.__pixmap.size() == size:
+            return self.__pixmap
+
+        key = (self.__pixmap.cacheKey(), size.width(), size.height())
+        if key != self._scaledKey:
+            self._scaledPixmap = self.__pixmap.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            self._scaledKey = key
+
+        return self._scaledPixmap
 
 
 
@@ -53,6 +82,9 @@ class FluentLabelBase(QLabel):
     * FluentLabelBase(`text`: str, `parent`: QWidget = None) - 创建带文本的标签
     """
 
+    _fontCache = {}  # 各标签类的字体缓存 {标签类: QFont}，同类标签共享同一字体
+    _contextMenu = None  # 所有标签共享的上下文菜单，首次请求时创建
+
     # 使用 singledispatchmethod 实现多态构造函数
     @singledispatchmethod
     def __init__(self, parent: QWidget = None):
@@ -67,14 +99,13 @@ class FluentLabelBase(QLabel):
 
     def _init(self):
         FluentStyleSheet.LABEL.apply(self)
-        # 设置字体（由子类实现）
-        self.setFont(self.getFont())
-        # 设置文本颜色（默认值）
+        # 设置字体（由子类实现），每个标签类只构建一次，setFont 会复制字体，共享缓存是安全的
+        font = FluentLabelBase._fontCache.get(type(self))
+        if font is None:
+            font = FluentLabelBase._fontCache[type(self)] = self.getFont()
+        self.setFont(font)
+        # 设置文本颜色（默认值），主题切换时由样式表管理器统一更新，无需逐个连接信号
         self.setTextColor()
-        # 连接主题变化信号，实现主题切换时自动更新颜色
-        connect = qconfig.themeChanged.connect(lambda: self.setTextColor(self.lightColor, self.darkColor))
-        # 确保在控件销毁时断开信号连接，防止内存泄漏
-        self.destroyed.connect(lambda: self.disconnect(connect))
 
         # 连接上下文菜单请求信号
         self.customContextMenuRequested.connect(self._onContextMenuRequested)
@@ -83,7 +114,7 @@ class FluentLabelBase(QLabel):
     def getFont(self):
         raise NotImplementedError
 
-    def setTextColor(self, light=QColor(0, 0, 0), dark=QColor(255, 255, 255)):
+    def setTextColor(self, light=_BLACK, dark=_WHITE):
         """ 设置标签的文本颜色
 
         参数
@@ -91,15 +122,21 @@ class FluentLabelBase(QLabel):
         light, dark: QColor | Qt.GlobalColor | str
             亮色/暗色模式下的文本颜色
         """
-        # 保存颜色设置
+        # 保存颜色设置（复制一份，避免调用者通过属性修改到共享的默认颜色）
         self._lightColor = QColor(light)
         self._darkColor = QColor(dark)
 
+        # 默认颜色已由全局样式表 FluentStyleSheet.LABEL 提供，无需为每个实例生成自定义样式表
+        if self._lightColor == _BLACK and self._darkColor == _WHITE:
+            if self.property(CustomStyleSheet.LIGHT_QSS_KEY):
+                setCustomStyleSheet(self, '', '')   # 清除之前设置的自定义颜色
+            return
+
         # 设置自定义样式表，实现根据主题自动切换颜色
         setCustomStyleSheet(
             self,
-            f"FluentLabelBase{{color:{self.lightColor.name(QColor.NameFormat.HexArgb)}}}",
-            f"FluentLabelBase{{color:{self.darkColor.name(QColor.NameFormat.HexArgb)}}}"
+            f"FluentLabelBase{{color:{_colorName(self._lightColor)}}}",
+            f"FluentLabelBase{{color:{_colorName(self._darkColor)}}}"
         )
         
 
@@ -156,17 +193,24 @@ class FluentLabelBase(QLabel):
     @underline.setter
     def underline(self, isUnderline: bool):
         font = self.font()
-        font.setStyle()  # 设置字体样式
         font.setUnderline(isUnderline)  # 设置下划线
         self.setFont(font)
 
     # 上下文菜单请求事件处理函数
     def _onContextMenuRequested(self, pos):
-        # 创建标签的上下文菜单
-        menu = LabelContextMenu(parent=self)
+        # 所有标签共享同一个上下文菜单，显示前切换到当前标签
+        menu = self._sharedContextMenu()
+        menu.setLabel(self)
         # 在鼠标位置显示上下文菜单（转换为全局坐标）
         menu.exec(self.mapToGlobal(pos))
 
+    @classmethod
+    def _sharedContextMenu(cls) -> LabelContextMenu:
+        """ 获取共享的标签上下文菜单，首次调用时创建 """
+        if FluentLabelBase._contextMenu is None:
+            FluentLabelBase._contextMenu = LabelContextMenu()
+        return FluentLabelBase._contextMenu
+
 
 class MessageBodyLabel(FluentLabelBase):
     """ 消息体文本标签 """
@@ -224,6 +268,14 @@ class ImageLabel(QLabel):
         super().__init__(parent)
         
         self.image = QImage()
+        self._cachedPath = None           # 缓存的圆角裁剪路径
+        self._cachedPathKey = None
+        self._cachedScaledPixmap = None   # 缓存的按设备像素比缩放后的像素图
+        self._cachedPixmapKey = None
+        self._pixmap = None               # pixmap() 返回的像素图缓存，与 _pixmapImageKey 对应的图像一致
+        self._pixmapImageKey = None
+        self._frameCache = {}             # 动画帧缓存 {帧序号: 预乘格式的帧图像}
+        self._framePixmaps = {}           # 动画帧合成结果缓存 {像素图缓存键: 合成后的像素图}
         self.setBorderRadius(0, 0, 0, 0)  # 设置默认的四个角的边框圆角为 0（无圆角）
         self._postInit()    # 调用子类可能重写的初始化后方法
 
@@ -252,7 +304,15 @@ class ImageLabel(QLabel):
 
     def _onFrameChanged(self, index: int):
         """ 当图像帧改变时调用，更新当前显示的图像 """
-        self.image = self.movie().currentImage()
+        image = self._frameCache.get(index)
+        if image is None:
+            movie = self.movie()
+            image = self._toPremultiplied(movie.currentImage())
+            # 仅在帧数已知时缓存，缓存大小不超过帧数
+            if 0 <= index < movie.frameCount():
+                self._frameCache[index] = image
+
+        self.image = image
         self.update()
 
     def setBorderRadius(self, topLeft: int, topRight: int, bottomLeft: int, bottomRight: int):
@@ -268,17 +328,35 @@ class ImageLabel(QLabel):
         self.image = image or QImage()
 
         if isinstance(image, str):
-            reader = QImageReader(image)
-            if reader.supportsAnimation():
-                self.setMovie(QMovie(image)) # 设置动画图像
+            info = QFileInfo(image)
+            key = (info.absoluteFilePath(), info.lastModified().toMSecsSinceEpoch(), info.size())
+            cached = _IMAGE_CACHE.get(key)
+
+            if cached is not None:
+                self.image = QImage(cached) # 缓存中只有静态图像，命中时无需再探测格式和解码；返回隐式共享的副本，写时才复制
             else:
-                self.image = reader.read()
+                reader = QImageReader(image)
+                if reader.supportsAnimation():  # 仅读取文件头判断是否为动画
+                    self.setMovie(QMovie(image)) # 设置动画图像
+                else:
+                    self.image = self._toPremultiplied(reader.read())
+                    if not self.image.isNull():
+                        _IMAGE_CACHE.put(key, QImage(self.image)) # 缓存持有独立的句柄，标签修改自身图像不会影响缓存
         elif isinstance(image, QPixmap):
             self.image = image.toImage()
 
+        self.image = self._toPremultiplied(self.image)
         self.setFixedSize(self.image.size())
         self.update()
 
+    @staticmethod
+    def _toPremultiplied(image: QImage) -> QImage:
+        """ 将图像一次性转换为预乘 ARGB32 格式（Qt 光栅绘制的最优格式），避免每次绘制时再转换 """
+        if image.isNull() or image.format() == QImage.Format_ARGB32_Premultiplied:
+            return image
+
+        return image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
     def scaledToWidth(self, width: int):
         """ 按宽度缩放图像标签的图像 """
         if self.isNull():
@@ -288,7 +366,7 @@ class ImageLabel(QLabel):
         self.setFixedSize(width, h)
 
         if self.movie():
-            self.movie().setScaledSize(QSize(width, h))
+            self._setMovieScaledSize(QSize(width, h))
 
     def scaledToHeight(self, height: int):
         """ 按高度缩放图像标签的图像 """
@@ -299,7 +377,7 @@ class ImageLabel(QLabel):
         self.setFixedSize(w, height)
 
         if self.movie():
-            self.movie().setScaledSize(QSize(w, height))
+            self._setMovieScaledSize(QSize(w, height))
 
     def setScaledSize(self, size: QSize):
         """ 设置图像标签的缩放大小 """
@@ -309,7 +387,13 @@ class ImageLabel(QLabel):
         self.setFixedSize(size)
 
         if self.movie():
-            self.movie().setScaledSize(size)
+            self._setMovieScaledSize(size)
+
+    def _setMovieScaledSize(self, size: QSize):
+        """ 设置动画的缩放大小，已缓存的帧尺寸失效，一并清空 """
+        self.movie().setScaledSize(size)
+        self._frameCache.clear()
+        self._framePixmaps.clear()
 
     def isNull(self):
         """ 判断图像标签是否为空 """
@@ -326,11 +410,19 @@ class ImageLabel(QLabel):
 
     def pixmap(self) -> QPixmap:
         """ 获取图像标签的图像为 QPixmap 对象 """
-        return QPixmap.fromImage(self.image)
+        # 图像未变化时复用上次转换的结果，返回隐式共享的副本，调用者修改时不会影响缓存
+        key = self.image.cacheKey()
+        if key != self._pixmapImageKey:
+            self._pixmap = QPixmap.fromImage(self.image)
+            self._pixmapImageKey = key
+
+        return QPixmap(self._pixmap)
 
     def setMovie(self, movie: QMovie):
         """ 设置图像标签的动画为 QMovie 对象 """
         super().setMovie(movie)
+        self._frameCache.clear()
+        self._framePixmaps.clear()
         self.movie().start()
         self.image = self.movie().currentImage()
         self.movie().frameChanged.connect(self._onFrameChanged)
@@ -340,11 +432,18 @@ class ImageLabel(QLabel):
         if self.isNull():
             return
 
+        # 圆角已预先合成到像素图中，绘制时只需一次贴图
         painter = QPainter(self)
-        painter.setRenderHints(QPainter.Antialiasing) # 开启反锯齿渲染
+        painter.drawPixmap(self.rect(), self._scaledPixmap())
 
-        path = QPainterPath() # 创建一个路径对象
+    def _clipPath(self) -> QPainterPath:
+        """ 获取圆角裁剪路径，仅在尺寸或圆角变化时重建 """
         w, h = self.width(), self.height()
+        key = (w, h, self._topLeftRadius, self._topRightRadius, self._bottomLeftRadius, self._bottomRightRadius)
+        if key == self._cachedPathKey:
+            return self._cachedPath
+
+        path = QPainterPath() # 创建一个路径对象
 
         # 绘制顶部线
         path.moveTo(self.topLeftRadius, 0)
@@ -375,13 +474,49 @@ class ImageLabel(QLabel):
         d = self.topLeftRadius * 2
         path.arcTo(0, 0, d, d, -180, -90)
 
-        # 绘制图像
-        image = self.image.scaled(
-            self.size()*self.devicePixelRatioF(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        self._cachedPath, self._cachedPathKey = path, key
+        return path
+
+    def _scaledPixmap(self) -> QPixmap:
+        """ 获取缩放到控件物理像素尺寸并合成圆角的像素图，仅在图像、尺寸、圆角或设备像素比变化时重新生成 """
+        size = self.size() * self.devicePixelRatioF()
+        radii = (self._topLeftRadius, self._topRightRadius, self._bottomLeftRadius, self._bottomRightRadius)
+        key = (self.image.cacheKey(), size.width(), size.height(), radii)
+        if key == self._cachedPixmapKey:
+            return self._cachedScaledPixmap
+
+        # 动画帧的合成结果按帧缓存，循环播放时每帧只合成一次
+        pixmap = self._framePixmaps.get(key)
+        if pixmap is None:
+            image = self.image.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+            # 无圆角时直接转换为像素图，跳过裁剪合成
+            if any(radii):
+                pixmap = self._maskedPixmap(image, self._clipPath())
+            else:
+                pixmap = QPixmap.fromImage(image) # 转换为像素图，绘制时走 drawPixmap 快速路径
+
+            frameCount = self.movie().frameCount() if self.movie() else 0
+            if frameCount > 0:
+                if len(self._framePixmaps) >= frameCount:
+                    self._framePixmaps.clear()  # 尺寸或圆角变化后旧的合成结果不再使用
+                self._framePixmaps[key] = pixmap
+
+        self._cachedScaledPixmap, self._cachedPixmapKey = pixmap, key
+        return pixmap
 
-        painter.setPen(Qt.NoPen) # 不绘制边框
-        painter.setClipPath(path) # 设置裁剪路径为图像标签的圆角路径
-        painter.drawImage(self.rect(), image) # 绘制图像，将其裁剪为圆角路径
+    def _maskedPixmap(self, image: QImage, path: QPainterPath) -> QPixmap:
+        """ 将图像按裁剪路径预先合成为带透明边角的像素图，替代每次绘制时的路径裁剪 """
+        pixmap = QPixmap(image.size())
+        pixmap.fill(Qt.transparent)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+
+        painter = QPainter(pixmap)
+        painter.setRenderHints(QPainter.Antialiasing) # 开启反锯齿渲染，使边角平滑
+        painter.setClipPath(path)
+        painter.drawImage(self.rect(), image)
+        painter.end()
+        return pixmap
 
     @pyqtProperty(int)
     def topLeftRadius(self):
@@ -423,6 +558,7 @@ class AvatarWidget(ImageLabel):
 
     
     def _postInit(self):
+        self._thumbnailPath = None  # 按头像尺寸解码缩略图时记录的图像路径，半径增大时用于重新解码
         self.setRadius(48)  # 设置头像的默认半径为 48 像素（直径为 96 像素）
         self.lightBackgroundColor = QColor(0, 0, 0, 50) # 设置亮色主题下的背景颜色（黑色，透明度 50）
         self.darkBackgroundColor = QColor(255, 255, 255, 50)    # 设置暗色主题下的背景颜色（白色，透明度 50）
@@ -439,16 +575,59 @@ class AvatarWidget(ImageLabel):
         setFont(self, radius)
         # 设置头像的固定大小为直径（2*radius）
         self.setFixedSize(2*radius, 2*radius)
+        # 缩略图分辨率不足以覆盖新的头像尺寸时，从文件重新解码
+        self._ensureThumbnail()
         # 更新显示
         self.update()
 
     # 重写父类的 setImage 方法，设置头像图像
     def setImage(self, image: Union[str, QPixmap, QImage] = None):
+        self._thumbnailPath = None
+
+        # 静态图像文件直接按头像尺寸解码缩略图，避免解码整张大图
+        if isinstance(image, str):
+            reader = QImageReader(image)
+            if not reader.supportsAnimation():
+                path, image = image, self._readThumbnail(reader)
+                # 仅在缩略图解码成功时记录路径，解码失败时不再重新解码
+                if reader.scaledSize().isValid() and not image.isNull():
+                    self._thumbnailPath = path
+
         # 调用父类的 setImage 方法设置图像
         super().setImage(image)
         # 确保设置图像后半径保持不变
         self.setRadius(self.radius)
 
+    # 计算头像的物理像素直径
+    def _avatarDiameter(self) -> int:
+        return ceil(self._radius * 2 * self.devicePixelRatioF())
+
+    # 判断图像尺寸是否足以覆盖整个头像区域
+    def _coversAvatar(self, size: QSize) -> bool:
+        d = self._avatarDiameter()
+        return size.width() >= d and size.height() >= d
+
+    # 缩略图分辨率不足以覆盖当前头像（半径增大或移到设备像素比更高的屏幕）时，从文件重新解码
+    def _ensureThumbnail(self):
+        if not self._thumbnailPath or self.isNull() or self._coversAvatar(self.image.size()):
+            return
+
+        reader = QImageReader(self._thumbnailPath)
+        image = self._readThumbnail(reader)
+        if reader.scaledSize().isValid() and not image.isNull():
+            self.image = self._toPremultiplied(image)
+        else:
+            self._thumbnailPath = None  # 文件已无法按缩略图解码，保留现有图像且不再重试
+
+    # 解码图像，原图大于头像时让解码器直接输出刚好覆盖头像区域的缩略图
+    def _readThumbnail(self, reader: QImageReader) -> QImage:
+        size = reader.size()
+        d = self._avatarDiameter()
+        if size.isValid() and size.width() > d and size.height() > d:
+            reader.setScaledSize(size.scaled(d, d, Qt.KeepAspectRatioByExpanding))
+
+        return reader.read()
+
     # 设置头像的背景颜色
     def setBackgroundColor(self, light: QColor, dark: QColor):
         # 设置亮色主题下的背景颜色
@@ -467,6 +646,8 @@ class AvatarWidget(ImageLabel):
 
         # 判断是否有图像
         if not self.isNull():
+            # 设备像素比可能在设置图像后变化，绘制前确认缩略图分辨率足够
+            self._ensureThumbnail()
             # 如果有图像，绘制图像头像
             self._drawImageAvatar(painter)
         else:
@@ -475,29 +656,37 @@ class AvatarWidget(ImageLabel):
 
     # 绘制图像头像的内部方法
     def _drawImageAvatar(self, painter: QPainter):
+        # 圆形裁剪已预先合成到像素图中，直接绘制
+        painter.drawPixmap(self.rect(), self._avatarPixmap())
+
+    # 获取缩放、居中裁剪并合成圆形遮罩后的头像像素图，仅在图像、半径或设备像素比变化时重新生成
+    def _avatarPixmap(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        key = (self.image.cacheKey(), self.getRadius(), dpr)
+        if key == self._cachedPixmapKey:
+            return self._cachedScaledPixmap
+
         # 中心裁剪图像以适应圆形区域
         # 将图像按比例缩放，保持宽高比并扩展以填充整个头像区域
         image = self.image.scaled(
-            self.size()*self.devicePixelRatioF(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)  # type: QImage
+            self.size()*dpr, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)  # type: QImage
 
         # 获取缩放后图像的宽度和高度
         iw, ih = image.width(), image.height()
         # 计算目标直径（考虑设备像素比）
-        d = self.getRadius() * 2 * self.devicePixelRatioF()
+        d = self.getRadius() * 2 * dpr
         # 计算裁剪起始坐标（居中裁剪）
         x, y = (iw - d) / 2, (ih - d) / 2
         # 裁剪图像为正方形
         image = image.copy(int(x), int(y), int(d), int(d))
 
-        # 创建圆形裁剪路径
+        # 创建圆形裁剪路径，并预先合成到像素图中
         path = QPainterPath()
         path.addEllipse(QRectF(self.rect()))
 
-        # 设置无画笔，使用裁剪路径
-        painter.setPen(Qt.NoPen)
-        painter.setClipPath(path)
-        # 绘制裁剪后的图像
-        painter.drawImage(self.rect(), image)
+        self._cachedScaledPixmap = self._maskedPixmap(image, path)
+        self._cachedPixmapKey = key
+        return self._cachedScaledPixmap
 
     # 绘制文本头像的内部方法
     def _drawTextAvatar(self, painter: QPainter):
@@ -1,6 +1,6 @@
 # 导入必要的模块
 from typing import List, Union
-from PyQt5.QtCore import QSize, Qt, QRectF, pyqtSignal, QPoint, QTimer, QEvent, QAbstractItemModel, pyqtProperty, QModelIndex,QSortFilterProxyModel
+from PyQt5.QtCore import QSize, Qt, QRectF, pyqtSignal, QPoint, QTimer, QEvent, QAbstractItemModel, pyqtProperty, QModelIndex,QSortFilterProxyModel, QRegularExpression
 from PyQt5.QtGui import QPainter, QPainterPath, QIcon, QColor, QPen   
 from PyQt5.QtWidgets import (QApplication, QAction, QHBoxLayout, QLineEdit, QToolButton, QTextEdit,
                              QPlainTextEdit, QCompleter, QStyle, QWidget, QTextBrowser)
@@ -128,44 +128,20 @@ class FuzzyProxyModel(QSortFilterProxyModel):
         self.setFilterCaseSensitivity(Qt.CaseInsensitive)
         self.setFilterRole(Qt.DisplayRole)
 
-        self._filter_text = "" # 用于存储当前过滤文本的实例变量
-
     def setFilterFixedString(self, pattern):
         """
-        重写 setFilterFixedString 方法，将过滤文本保存到我们自己的变量中。
-        """
-        self._filter_text = pattern.strip() # 去除首尾空格并保存
-
-        super().setFilterFixedString(pattern)
-
-    def filterAcceptsRow(self, source_row, source_parent):
-        """
-        重写此方法来实现自定义过滤逻辑。
+        重写 setFilterFixedString 方法，去除首尾空格后按子串匹配。
+        模式转义为正则表达式交给 Qt 过滤，逐行匹配在 C++ 中完成，无需为每一行回调 Python。
         """
-        # 直接使用我们自己存储的 _filter_text
-        filter_text = self._filter_text
-        
-        # 如果过滤文本为空，则显示所有行
-        if not filter_text:
-            return True
-
-        source_model = self.sourceModel()
-        if not source_model:
-            return False
-
-        index = source_model.index(source_row, self.filterKeyColumn(), source_parent)
-        if not index.isValid():
-            return False
-        
-        item_text = source_model.data(index, self.filterRole())
-        if not item_text:
-            return False
+        self.setFilterRegularExpression(self.filterExpression(pattern))
 
+    def filterExpression(self, pattern: str) -> QRegularExpression:
+        """ 根据过滤文本构建子串匹配的正则表达式（去除首尾空格，大小写规则与代理模型一致） """
+        options = QRegularExpression.NoPatternOption
         if self.filterCaseSensitivity() == Qt.CaseInsensitive:
-            # 检查 filter_text 是否是 item_text 的子串
-            return filter_text.lower() in item_text.lower()
-        else:
-            return filter_text in item_text
+            options = QRegularExpression.CaseInsensitiveOption
+
+        return QRegularExpression(QRegularExpression.escape(pattern.strip()), options)
 
 
 class LineEdit(QLineEdit):
@@ -182,6 +158,10 @@ class LineEdit(QLineEdit):
         """
         super().__init__(parent=parent)
         self._fuzzy_proxy_model = FuzzyProxyModel(self) # 创建一个代理模型实例
+        self._lastQuery = ""  # 上次过滤的文本（已去除首尾空格）
+        self._lastHits = None  # 上次过滤的结果 [(完成模型中的行号, 文本)]，为 None 表示缓存无效
+        self._lastHitsSource = None  # 上次过滤结果对应的 (完成模型, 列)
+        self._trackedModel = None  # 已监听数据变化的完成模型
         self._isClearButtonEnabled = False  # 清除按钮是否启用的标志
         self._completer = None  # 自动完成器对象
         self._completerMenu = None  # 自动完成菜单对象
@@ -209,6 +189,12 @@ class LineEdit(QLineEdit):
         self.hBoxLayout.setAlignment(Qt.AlignRight | Qt.AlignVCenter)  # 设置布局对齐方式
         self.hBoxLayout.addWidget(self.clearButton, 0, Qt.AlignRight)  # 添加清除按钮到布局
 
+        # 自动完成菜单的延迟刷新定时器，连续输入时只在停顿后刷新一次
+        self._completerTimer = QTimer(self)
+        self._completerTimer.setSingleShot(True)
+        self._completerTimer.setInterval(50)
+        self._completerTimer.timeout.connect(self._showCompleterMenu)
+
         self.clearButton.clicked.connect(self.clear)  # 连接清除按钮的点击信号到clear槽函数
         self.textChanged.connect(self.__onTextChanged)  # 连接文本变化信号到__onTextChanged槽函数
         self.textEdited.connect(self.__onTextEdited)  # 连接文本编辑信号到__onTextEdited槽函数
@@ -274,6 +260,7 @@ class LineEdit(QLineEdit):
         :param completer: QCompleter - 自动完成器对象
         """
         self._completer = completer  # 存储自动完成器
+        self._invalidateCompletionCache()  # 自动完成器变化后，上次的过滤结果失效
 
     def completer(self):
         """ 获取自动完成器
@@ -359,9 +346,11 @@ class LineEdit(QLineEdit):
             return  # 直接返回
 
         if self.text():  # 如果文本不为空
-            QTimer.singleShot(50, self._showCompleterMenu)  # 延迟50毫秒显示自动完成菜单
-        elif self._completerMenu:  # 如果文本为空且自动完成菜单存在
-            self._completerMenu.close()  # 关闭自动完成菜单
+            self._completerTimer.start()  # 重新计时，停止输入50毫秒后显示自动完成菜单
+        else:
+            self._completerTimer.stop()  # 文本已清空，取消尚未执行的刷新
+            if self._completerMenu:  # 如果自动完成菜单存在
+                self._completerMenu.close()  # 关闭自动完成菜单
 
     def setCompleterMenu(self, menu):
         """ 设置自动完成菜单
@@ -411,22 +400,42 @@ class LineEdit(QLineEdit):
         if not source_model:
             return
 
-        # 2. 将原始模型设置为模糊代理模型的源模型
-        self._fuzzy_proxy_model.setSourceModel(source_model)
-        
-        # 3. 设置要过滤的列（通常是第0列）
-        self._fuzzy_proxy_model.setFilterKeyColumn(current_completer.completionColumn())
+        column = current_completer.completionColumn()
+        query = self.text().strip()
+        self._trackCompletionModel(source_model)
 
-        # 4. 将输入框的当前文本设置为代理模型的过滤文本
-        self._fuzzy_proxy_model.setFilterFixedString(self.text())
-        
-        # --- 核心改动结束 ---
+        # 新文本是在上次文本之后继续输入时，匹配结果必然是上次结果的子集，只需在上次结果中过滤
+        if (self._lastHits is not None and self._lastHitsSource == (source_model, column)
+                and query.startswith(self._lastQuery)):
+            regex = self._fuzzy_proxy_model.filterExpression(query)
+            hits = [(row, text) for row, text in self._lastHits if regex.match(text).hasMatch()]
+        else:
+            # 2. 将原始模型设置为模糊代理模型的源模型
+            self._fuzzy_proxy_model.setSourceModel(source_model)
+
+            # 3. 设置要过滤的列（通常是第0列）
+            self._fuzzy_proxy_model.setFilterKeyColumn(column)
 
-        # 5. 将 FILTERED MODEL (代理模型) 传递给 CompleterMenu
-        changed = self._completerMenu.setCompletion(
-            self._fuzzy_proxy_model,  # <-- 这里不再是 source_model
-            current_completer.completionColumn()
-        )
+            # 4. 将输入框的当前文本设置为代理模型的过滤文本
+            self._fuzzy_proxy_model.setFilterFixedString(query)
+
+            # 5. 将过滤结果映射回完成模型中的行
+            proxy = self._fuzzy_proxy_model
+            hits = []
+            for i in range(proxy.rowCount()):
+                index = proxy.index(i, column)
+                text = proxy.data(index, Qt.DisplayRole)  # 空行的显示数据为 None，与代理模型一样按空字符串匹配
+                hits.append((proxy.mapToSource(index).row(), "" if text is None else str(text)))
+
+        # 两条路径都以完成模型中的行设置菜单，菜单发出的索引始终来自完成模型
+        changed = self._completerMenu.setCompletionRows(source_model, [row for row, _ in hits], column)
+
+        # 记录本次过滤结果，供下次输入时增量过滤
+        self._lastQuery = query
+        self._lastHits = hits
+        self._lastHitsSource = (source_model, column)
+
+        # --- 核心改动结束 ---
 
 
         # 添加菜单项
@@ -444,6 +453,32 @@ class LineEdit(QLineEdit):
             # QCompleter 通常会将菜单显示在输入框下方
             self._completerMenu.popup()
 
+    def _invalidateCompletionCache(self, *args):
+        """ 使增量过滤缓存失效，下次显示自动完成菜单时重新过滤整个完成模型 """
+        self._lastHits = None
+
+    def _trackCompletionModel(self, model: QAbstractItemModel):
+        """ 监听完成模型的数据变化，模型内容变化时使增量过滤缓存失效
+        
+        :param model: QAbstractItemModel - 自动完成器的完成模型
+        """
+        if model is self._trackedModel:
+            return
+
+        signals = ('modelReset', 'layoutChanged', 'rowsInserted', 'rowsRemoved', 'dataChanged')
+        if self._trackedModel is not None:
+            for name in signals:
+                try:
+                    getattr(self._trackedModel, name).disconnect(self._invalidateCompletionCache)
+                except (TypeError, RuntimeError):
+                    pass
+
+        for name in signals:
+            getattr(model, name).connect(self._invalidateCompletionCache)
+
+        self._trackedModel = model
+        self._invalidateCompletionCache()
+
     def contextMenuEvent(self, e):
         """ 上下文菜单事件处理
         
@@ -511,11 +546,22 @@ class CompleterMenu(RoundMenu):
         :param column: int - 从模型中获取数据的列索引，默认为0
         :return: bool - True表示菜单项有变化，False表示无变化
         """
+        return self.setCompletionRows(model, range(model.rowCount()), column)
+
+    def setCompletionRows(self, model: QAbstractItemModel, rows, column=0):
+        """ 使用模型中的指定行设置自动完成菜单项
+
+        :param model: QAbstractItemModel - 提供自动完成数据的模型
+        :param rows: Iterable[int] - 要显示的行号
+        :param column: int - 从模型中获取数据的列索引，默认为0
+        :return: bool - True表示菜单项有变化，False表示无变化
+        """
         items = []  # 临时存储菜单项文本
         self.indexes.clear()  # 清空索引列表
-        for i in range(model.rowCount()):  # 遍历模型的所有行
-            items.append(model.data(model.index(i, column)))  # 获取指定行列的数据并添加到列表
-            self.indexes.append(model.index(i, column))  # 存储对应的模型索引
+        for row in rows:  # 遍历指定的行
+            index = model.index(row, column)
+            items.append(model.data(index, Qt.DisplayRole))  # 获取指定行列的数据并添加到列表
+            self.indexes.append(index)  # 存储对应的模型索引
 
         if self.items == items and self.isVisible():  # 如果新菜单项与当前菜单项相同且菜单可见
             return False  # 返回False表示无变化
@@ -1,6 +1,8 @@
+import weakref
 from enum import Enum
 from typing import List, Union
 
+from PyQt5 import sip
 from qframelesswindow import WindowEffect
 from PyQt5.QtCore import (QEasingCurve, QEvent, QPropertyAnimation, QObject, QModelIndex,
                           Qt, QSize, QRectF, pyqtSignal, QPoint, QTimer, QParallelAnimationGroup, QRect)
@@ -1349,10 +1351,12 @@ class CheckableSystemTrayMenu(CheckableMenu):
 class LabelContextMenu(RoundMenu):
     """ 标签上下文菜单 """
 
-    def __init__(self, parent: QLabel):
-        """初始化标签上下文菜单"""
+    def __init__(self, parent: QLabel = None):
+        """初始化标签上下文菜单（不指定父标签时可通过 setLabel 在多个标签间共享）"""
         super().__init__("", parent)
-        self.selectedText = parent.selectedText()
+        self._label = None
+        self.setLabel(parent)
+        self.selectedText = parent.selectedText() if parent else ""
 
         self.copyAct = QAction(
             FIF.COPY.icon(),
@@ -1374,15 +1378,33 @@ class LabelContextMenu(RoundMenu):
 
     def _onSelectAll(self):
         """全选操作"""
-        self.label().setSelection(0, len(self.label().text()))
+        label = self.label()
+        if label is not None:
+            label.setSelection(0, len(label.text()))
 
     def label(self) -> QLabel:
-        """获取标签部件"""
-        return self.parent()
+        """获取标签部件，标签已被销毁时返回 None"""
+        label = self._label() if self._label else None
+        if label is None or sip.isdeleted(label):
+            return None
+
+        return label
+
+    def setLabel(self, label: QLabel):
+        """设置菜单作用的标签部件（仅保存弱引用，共享菜单不会延长标签的生命周期）"""
+        self._label = weakref.ref(label) if label is not None else None
 
     def exec(self, pos, ani=True, aniType=MenuAnimationType.DROP_DOWN):
         """显示菜单，根据选中状态调整显示的动作"""
-        if self.label().hasSelectedText():
+        # 菜单会被标签复用，每次显示前刷新选中文本并重建动作
+        self.clear()
+        label = self.label()
+        if label is None:
+            return
+
+        self.selectedText = label.selectedText()
+
+        if label.hasSelectedText():
             self.addActions([self.copyAct, self.selectAllAct])
         else:
             self.addAction(self.selectAllAct)
@@ -0,0 +1,40 @@
+import pytest
+from PyQt5.QtCore import QPoint, QPointF, QSize, Qt
+from PyQt5.QtGui import QWheelEvent
+
+
+def _wheel(widget, delta):
+    """ 发送一次滚轮事件，delta < 0 为向下滚动 """
+    e = QWheelEvent(QPointF(10, 10), QPointF(10, 10), QPoint(0, 0), QPoint(0, delta),
+                    Qt.NoButton, Qt.NoModifier, Qt.NoScrollPhase, False)
+    widget.wheelEvent(e)
+
+
+@pytest.mark.parametrize("burst, expected", [(40, "4"), (-40, "8"), (12, "0"), (-1, "11")])
+def test_cycle_wheel_burst_wraps(qapp, burst, expected):
+    """ 超过列表长度的滚轮连发应按整圈取余，落在与逐步滚动相同的项目上 """
+    from QtUniversalToolFrameWork.components.widgets.cycle_list_widget import CycleListWidget
+
+    w = CycleListWidget(range(12), QSize(80, 33))
+    for _ in range(abs(burst)):
+        _wheel(w, -120 if burst > 0 else 120)
+
+    w._wheelTimer.stop()
+    w._flushWheel()
+
+    assert 0 <= w.currentIndex() < w.count()
+    assert w.currentItem().text() == expected
+
+
+def test_non_cycle_wheel_burst_clamps(qapp):
+    """ 非循环模式下滚轮连发应停在首尾有效项目上 """
+    from QtUniversalToolFrameWork.components.widgets.cycle_list_widget import CycleListWidget
+
+    w = CycleListWidget(range(5), QSize(80, 33))
+    for delta in (-120, 120):
+        for _ in range(40):
+            _wheel(w, delta)
+
+        w._wheelTimer.stop()
+        w._flushWheel()
+        assert w.currentItem().text() == ("4" if delta < 0 else "0")